@@ -1,63 +1,239 @@
 """
 Configuration Management Module
-Implements Singleton pattern for centralized configuration management
+Provides a shared module-level instance for centralized configuration management
 """
+import functools
 import os
-import yaml
-from typing import Dict, Any, Optional
+import pickle
+import tempfile
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
-from dotenv import load_dotenv
+
+# Note: yaml is imported lazily inside the functions that need it so that
+# importing this module (e.g. during pytest collection) does not pay its
+# startup cost
+
+
+# Default values for environment-driven settings, resolved through a single
+# snapshot of (.env values + os.environ) instead of repeated os.getenv calls
+DEFAULTS: Dict[str, str] = {
+    'ENVIRONMENT': 'dev',
+    'BROWSER': 'chromium',
+    'HEADLESS': 'false',
+    'BASE_URL': 'https://example.com',
+    'TIMEOUT': '30000',
+    'SLOW_MO': '0',
+    'VIDEO': 'on_failure',
+    'SCREENSHOT': 'only-on-failure',
+    'SCREENSHOT_ON_ERROR': 'true',
+    'BLOCK_RESOURCES': 'false',
+    'REUSE_CONTEXT': 'false',
+    'LOG_LEVEL': 'INFO',
+}
+
+
+# Directories already created in this process - lets _create_directories
+# short-circuit without re-issuing mkdir/stat syscalls
+_MADE_DIRS: set = set()
+
+
+# Process-wide guard so .env is parsed at most once per interpreter, even
+# though Config is imported from multiple conftests. The environment marker
+# extends the guard across subprocesses that inherit our environment.
+_DOTENV_LOADED = False
+_dotenv_cache: Dict[str, Optional[str]] = {}
+
+
+def _fast_parse_env(env_path: Path) -> Dict[str, str]:
+    """
+    Parse a simple KEY=value .env file in a single pass over raw bytes.
+
+    Handles the subset of .env syntax this framework uses (comments, blank
+    lines, optional single/double quotes) without pulling in python-dotenv
+    and its per-line regex machinery.
+
+    Args:
+        env_path: Path to .env file
+
+    Returns:
+        Dict of values parsed from .env
+    """
+    out: Dict[str, str] = {}
+    with open(env_path, 'rb') as file:
+        data = file.read()
+
+    for line in data.splitlines():
+        line = line.strip()
+        if not line or line[:1] == b'#' or b'=' not in line:
+            continue
+        key, _, value = line.partition(b'=')
+        out[key.strip().decode()] = value.decode().strip().strip('"').strip("'")
+
+    return out
+
+
+def _load_dotenv_once(env_path: Path) -> Dict[str, Optional[str]]:
+    """
+    Parse the .env file once and apply it to os.environ.
+
+    Subsequent calls (and child processes carrying the CONFIG_DOTENV_LOADED
+    marker) skip the file read entirely and reuse the cached dict.
+
+    Args:
+        env_path: Path to .env file
+
+    Returns:
+        Dict of values parsed from .env
+    """
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED or os.environ.get('CONFIG_DOTENV_LOADED'):
+        return _dotenv_cache
+
+    if env_path.exists():
+        _dotenv_cache.update(_fast_parse_env(env_path))
+
+    # Apply without overriding values already present in the environment
+    for key, value in _dotenv_cache.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+    os.environ['CONFIG_DOTENV_LOADED'] = '1'
+    _DOTENV_LOADED = True
+    return _dotenv_cache
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Load and parse a YAML file, memoized per (path, mtime).
+
+    The mtime key keeps the cache correct across file edits while letting
+    repeated Config constructions (e.g. per pytest-xdist worker helper
+    scripts) reuse the already-parsed dict. A pickled sidecar next to the
+    YAML file lets fresh interpreters skip YAML parsing entirely.
+
+    Args:
+        path_str: Path to YAML file as string
+        mtime_ns: File modification time in nanoseconds (cache key)
+
+    Returns:
+        Dict containing parsed YAML data
+    """
+    path = Path(path_str)
+    pkl_path = path.with_suffix(path.suffix + '.pkl')
+
+    # Reuse the pickle sidecar if it is at least as new as the YAML source -
+    # unpickling a dict graph is far cheaper than re-parsing YAML
+    try:
+        if pkl_path.stat().st_mtime_ns >= mtime_ns:
+            with open(pkl_path, 'rb') as file:
+                return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    import yaml
+
+    # Use the libyaml C loader when available - several times faster than
+    # the pure-Python loader that yaml.safe_load falls back to
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    with open(path, 'r') as file:
+        data = yaml.load(file, Loader=loader) or {}
+
+    # Write the sidecar atomically (best effort - a read-only checkout
+    # simply falls back to parsing YAML every time)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix='.pkl.tmp')
+        with os.fdopen(fd, 'wb') as tmp_file:
+            pickle.dump(data, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pkl_path)
+    except OSError:
+        pass
+
+    return data
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file through the mtime-keyed cache.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Dict containing YAML data, or empty dict if file does not exist
+    """
+    if not path.exists():
+        return {}
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
 
 
 class Config:
     """
-    Singleton Configuration class for managing application settings.
+    Configuration class for managing application settings.
     Loads environment variables and YAML configuration files.
-    """
-    _instance: Optional['Config'] = None
-    _initialized: bool = False
 
-    def __new__(cls) -> 'Config':
-        """Implement Singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-        return cls._instance
+    The shared instance lives at module level as `config`; importing that
+    instance replaces the former __new__-based Singleton machinery.
+    """
 
     def __init__(self):
-        """Initialize configuration only once."""
-        if not Config._initialized:
-            # Load environment variables from .env file
-            env_path = Path(__file__).parent.parent / '.env'
-            load_dotenv(dotenv_path=env_path)
-            
-            # Load basic configuration
-            self.environment = os.getenv('ENVIRONMENT', 'dev')
-            self.browser = os.getenv('BROWSER', 'chromium')
-            self.headless = os.getenv('HEADLESS', 'false').lower() == 'true'
-            self.base_url = os.getenv('BASE_URL', 'https://example.com')
-            self.timeout = int(os.getenv('TIMEOUT', '30000'))
-            self.slow_mo = int(os.getenv('SLOW_MO', '0'))
-            self.video = os.getenv('VIDEO', 'on_failure')
-            self.screenshot = os.getenv('SCREENSHOT', 'only-on-failure')
-            self.log_level = os.getenv('LOG_LEVEL', 'INFO')
-            
-            # Load environment-specific configuration
-            self.env_config = self._load_environment_config()
-            
-            # Load test data
-            self.test_data = self._load_test_data()
-            
-            # Set paths
-            self.root_dir = Path(__file__).parent.parent
-            self.reports_dir = self.root_dir / 'reports'
-            self.screenshots_dir = self.reports_dir / 'screenshots'
-            self.videos_dir = self.reports_dir / 'videos'
-            self.allure_results_dir = self.reports_dir / 'allure-results'
-            
-            # Create necessary directories
-            self._create_directories()
-            
-            Config._initialized = True
+        """Initialize configuration."""
+        # Load environment variables from .env file (parsed at most once)
+        env_path = Path(__file__).parent.parent / '.env'
+        dotenv_env = _load_dotenv_once(env_path)
+
+        # Snapshot .env and process environment into one lookup table;
+        # os.environ wins to preserve override semantics
+        env_map: Dict[str, Any] = {**DEFAULTS, **dotenv_env, **os.environ}
+
+        # Load basic configuration
+        self.environment = env_map['ENVIRONMENT']
+        self.browser = env_map['BROWSER']
+        self.headless = env_map['HEADLESS'].lower() == 'true'
+        self.base_url = env_map['BASE_URL']
+        self.timeout = int(env_map['TIMEOUT'])
+        self.slow_mo = int(env_map['SLOW_MO'])
+        self.video = env_map['VIDEO']
+        self.screenshot = env_map['SCREENSHOT']
+        self.screenshot_on_error = env_map['SCREENSHOT_ON_ERROR'].lower() == 'true'
+        self.block_resources = env_map['BLOCK_RESOURCES'].lower() == 'true'
+        self.reuse_context = env_map['REUSE_CONTEXT'].lower() == 'true'
+        self.log_level = env_map['LOG_LEVEL']
+
+        # Load environment-specific configuration
+        self.env_config = self._load_environment_config()
+
+        # Load test data
+        self.test_data = self._load_test_data()
+
+        # Set paths
+        self.root_dir = Path(__file__).parent.parent
+        self.reports_dir = self.root_dir / 'reports'
+        self.screenshots_dir = self.reports_dir / 'screenshots'
+        self.videos_dir = self.reports_dir / 'videos'
+        self.allure_results_dir = self.reports_dir / 'allure-results'
+
+        # Create necessary directories
+        self._create_directories()
+
+        # Resolve frequently-read values once; the getters below return
+        # these cached results instead of rebuilding them per call
+        self._resolved_base_url: str = self.env_config.get('base_url', self.base_url)
+        self._resolved_timeout: int = self.env_config.get('timeout', self.timeout)
+        self._browser_settings: Mapping[str, Any] = MappingProxyType({
+            'browser': self.browser,
+            'headless': self.headless,
+            'slow_mo': self.slow_mo,
+            'timeout': self._resolved_timeout,
+            'video': self.video,
+            'screenshot': self.screenshot
+        })
+        self._logging_config: Mapping[str, Any] = MappingProxyType({
+            'level': self.log_level,
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S'
+        })
 
     def _load_environment_config(self) -> Dict[str, Any]:
         """
@@ -67,10 +243,7 @@ class Config:
             Dict containing environment configuration
         """
         config_path = Path(__file__).parent / 'environments' / f'{self.environment}.yml'
-        if config_path.exists():
-            with open(config_path, 'r') as file:
-                return yaml.safe_load(file) or {}
-        return {}
+        return _load_yaml(config_path)
 
     def _load_test_data(self) -> Dict[str, Any]:
         """
@@ -80,10 +253,7 @@ class Config:
             Dict containing test data
         """
         test_data_path = Path(__file__).parent / 'test_data' / 'users.yml'
-        if test_data_path.exists():
-            with open(test_data_path, 'r') as file:
-                return yaml.safe_load(file) or {}
-        return {}
+        return _load_yaml(test_data_path)
 
     def _create_directories(self) -> None:
         """Create necessary directories if they don't exist."""
@@ -94,54 +264,45 @@ class Config:
             self.allure_results_dir
         ]
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            if directory not in _MADE_DIRS:
+                os.makedirs(directory, exist_ok=True)
+                _MADE_DIRS.add(directory)
 
     def get_base_url(self) -> str:
         """
         Get base URL for the application.
-        
+
         Returns:
             Base URL string
         """
-        return self.env_config.get('base_url', self.base_url)
+        return self._resolved_base_url
 
     def get_timeout(self) -> int:
         """
         Get default timeout value.
-        
+
         Returns:
             Timeout in milliseconds
         """
-        return self.env_config.get('timeout', self.timeout)
+        return self._resolved_timeout
 
-    def get_browser_settings(self) -> Dict[str, Any]:
+    def get_browser_settings(self) -> Mapping[str, Any]:
         """
         Get browser configuration settings.
-        
+
         Returns:
-            Dict containing browser settings
+            Read-only mapping containing browser settings
         """
-        return {
-            'browser': self.browser,
-            'headless': self.headless,
-            'slow_mo': self.slow_mo,
-            'timeout': self.get_timeout(),
-            'video': self.video,
-            'screenshot': self.screenshot
-        }
+        return self._browser_settings
 
-    def get_logging_config(self) -> Dict[str, Any]:
+    def get_logging_config(self) -> Mapping[str, Any]:
         """
         Get logging configuration.
-        
+
         Returns:
-            Dict containing logging settings
+            Read-only mapping containing logging settings
         """
-        return {
-            'level': self.log_level,
-            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            'datefmt': '%Y-%m-%d %H:%M:%S'
-        }
+        return self._logging_config
 
     def get_test_user(self, user_type: str = 'valid') -> Dict[str, str]:
         """
@@ -169,5 +330,6 @@ class Config:
         return self.env_config.get(key, default)
 
 
-# Create a singleton instance
+# Shared configuration instance - import this rather than constructing
+# Config directly
 config = Config()
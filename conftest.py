@@ -2,34 +2,38 @@
 Root Conftest Module
 Main pytest configuration with hooks and fixtures
 """
+import logging
 import pytest
 import allure
 import os
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Generator
 from playwright.sync_api import Page
 from pytest_bdd import given, when, then
 from config.config import config as project_config
 from utils.logger import Logger
-from utils.screenshot_helper import ScreenshotHelper
+from utils.screenshot_helper import ScreenshotHelper, screenshot_helper
 from utils.report_helper import ReportHelper
-from pages.login_page import LoginPage
-from pages.home_page import HomePage
-from pages.registration_page import RegistrationPage
-from pages.winvinaya_foundation_page import WinVinayaFoundationPage
 
 
 logger = Logger.get_logger(__name__)
 
 
-# Global list to store test results for CSV reporting
+# Banner line reused by the session hooks
+_BANNER = "=" * 80
+
+
+# Global list to store test results for CSV reporting. Each entry is a
+# (name, status, duration, error) tuple - cheaper to construct per test
+# than a dict; rows are expanded to dicts once at session finish.
 test_results = []
 
 
 # List of plugins to load
 pytest_plugins = [
-    "fixtures.browser_fixtures"
+    "fixtures.browser_fixtures",
+    "fixtures.page_fixtures"
 ]
 
 
@@ -44,34 +48,42 @@ def pytest_configure(config):
     Args:
         config: Pytest config object
     """
-    logger.info("=" * 80)
-    logger.info("PYTEST CONFIGURATION STARTED")
-    logger.info("=" * 80)
-    
-    # Create necessary directories
-    project_config.reports_dir.mkdir(parents=True, exist_ok=True)
-    project_config.screenshots_dir.mkdir(parents=True, exist_ok=True)
-    project_config.videos_dir.mkdir(parents=True, exist_ok=True)
-    project_config.allure_results_dir.mkdir(parents=True, exist_ok=True)
-    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_BANNER)
+        logger.info("PYTEST CONFIGURATION STARTED")
+        logger.info(_BANNER)
+
+    # Skip .pytest_cache reads/writes where --lf/--ff semantics are not
+    # needed (defaults on in CI, opt out with DISABLE_PYTEST_CACHE=0);
+    # saves session startup and per-test cache file I/O
+    disable_cache = os.environ.get(
+        'DISABLE_PYTEST_CACHE', '1' if os.environ.get('CI') else '0')
+    if disable_cache.lower() in ('1', 'true'):
+        config.pluginmanager.set_blocked('cacheprovider')
+        logger.info("Pytest cacheprovider disabled")
+
+    # Report directories are already created by Config._create_directories
     logger.info(f"Environment: {project_config.environment}")
     logger.info(f"Browser: {project_config.browser}")
     logger.info(f"Base URL: {project_config.get_base_url()}")
     logger.info(f"Headless: {project_config.headless}")
     logger.info(f"Reports Directory: {project_config.reports_dir}")
-    
-    # Add environment info to Allure report
-    env_info = {
-        'Environment': project_config.environment,
-        'Browser': project_config.browser,
-        'Base_URL': project_config.get_base_url(),
-        'Headless': str(project_config.headless),
-        'Timeout': str(project_config.timeout),
-        'Python_Version': os.sys.version.split()[0],
-        'Execution_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    }
-    
-    ReportHelper.add_environment_info(env_info)
+
+
+    # Add environment info to Allure report - written once per session by
+    # the controller process; xdist workers skip the redundant serialization
+    if not os.environ.get('PYTEST_XDIST_WORKER'):
+        env_info = {
+            'Environment': project_config.environment,
+            'Browser': project_config.browser,
+            'Base_URL': project_config.get_base_url(),
+            'Headless': str(project_config.headless),
+            'Timeout': str(project_config.timeout),
+            'Python_Version': os.sys.version.split()[0],
+            'Execution_Date': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+        ReportHelper.add_environment_info(env_info)
     logger.info("Pytest configuration completed")
 
 
@@ -84,21 +96,59 @@ def pytest_collection_modifyitems(config, items):
         items: List of test items
     """
     logger.info(f"Collected {len(items)} test items")
-    
-    # Add markers to tests based on their names
+
+    # Resolve marker objects once instead of per item
+    login_mark = pytest.mark.login
+    registration_mark = pytest.mark.registration
+
+    # Add markers to tests based on their file location, classifying each
+    # file only once - sibling tests reuse the cached result
+    path_to_mark = {}
     for item in items:
-        # Add feature markers based on file location
-        if 'login' in str(item.fspath):
-            item.add_marker(pytest.mark.login)
-        elif 'registration' in str(item.fspath):
-            item.add_marker(pytest.mark.registration)
+        path = item.path
+        try:
+            mark = path_to_mark[path]
+        except KeyError:
+            name = path.name
+            if 'login' in name:
+                mark = login_mark
+            elif 'registration' in name:
+                mark = registration_mark
+            else:
+                mark = None
+            path_to_mark[path] = mark
+
+        if mark is not None:
+            item.add_marker(mark)
 
 
 # ============================================================================
 # BDD Hooks
 # ============================================================================
 
-# Note: pytest-bdd hooks are handled automatically by the framework
+def pytest_bdd_before_scenario(request, feature, scenario):
+    """
+    Log scenario start as a single structured event.
+
+    Args:
+        request: Pytest request object
+        feature: BDD feature
+        scenario: BDD scenario
+    """
+    # Lazy %-formatting so the handler skips formatting when filtered out
+    logger.info("SCENARIO STARTED: %s", scenario.name)
+
+
+def pytest_bdd_after_scenario(request, feature, scenario):
+    """
+    Log scenario completion as a single structured event.
+
+    Args:
+        request: Pytest request object
+        feature: BDD feature
+        scenario: BDD scenario
+    """
+    logger.info("SCENARIO FINISHED: %s", scenario.name)
 
 
 # ============================================================================
@@ -128,32 +178,33 @@ def pytest_runtest_makereport(item, call):
                 logger.error(f"Test FAILED: {item.name}")
                 
                 try:
-                    screenshot_helper = ScreenshotHelper()
                     screenshot_path = screenshot_helper.capture_on_failure(page, item.name)
                     
                     if screenshot_path:
                         logger.info(f"Failure screenshot saved: {screenshot_path}")
-                        
-                        # Attach to Allure report
-                        with open(screenshot_path, 'rb') as f:
-                            allure.attach(
-                                f.read(),
-                                name=f"failure_{item.name}",
-                                attachment_type=allure.attachment_type.PNG
-                            )
+
+                        # Attach to Allure report without re-reading the PNG
+                        # into a Python bytes object - the helper already
+                        # wrote it to disk
+                        allure.attach.file(
+                            str(screenshot_path),
+                            name=f"failure_{item.name}",
+                            attachment_type=allure.attachment_type.PNG,
+                            extension='png'
+                        )
                 except Exception as e:
                     logger.error(f"Failed to capture failure screenshot: {str(e)}")
             
-            elif report.passed:
+            elif report.passed and logger.isEnabledFor(logging.INFO):
                 logger.info(f"Test PASSED: {item.name}")
 
-        # Collect result for CSV report
-        test_results.append({
-            'name': item.name,
-            'status': report.outcome,
-            'duration': report.duration,
-            'error': str(report.longrepr) if report.failed else ""
-        })
+        # Collect result for CSV report - render longrepr only on failure
+        test_results.append((
+            item.name,
+            report.outcome,
+            report.duration,
+            str(report.longrepr) if report.failed else ""
+        ))
 
 
 @pytest.fixture(scope='function', autouse=True)
@@ -164,72 +215,15 @@ def test_logger(request):
     Args:
         request: Pytest request object
     """
-    test_name = request.node.name
-    logger.info(f"Starting test: {test_name}")
-    
-    yield
-    
-    logger.info(f"Finished test: {test_name}")
-
-
-# ============================================================================
-# Page Object Fixtures
-# ============================================================================
-
-@pytest.fixture(scope='function')
-def login_page(page: Page) -> LoginPage:
-    """
-    Function-scoped LoginPage fixture.
-    
-    Args:
-        page: Page instance
-        
-    Returns:
-        LoginPage instance
-    """
-    return LoginPage(page)
-
-
-@pytest.fixture(scope='function')
-def home_page(page: Page) -> HomePage:
-    """
-    Function-scoped HomePage fixture.
-    
-    Args:
-        page: Page instance
-        
-    Returns:
-        HomePage instance
-    """
-    return HomePage(page)
-
-
-@pytest.fixture(scope='function')
-def registration_page(page: Page) -> RegistrationPage:
-    """
-    Function-scoped RegistrationPage fixture.
-    
-    Args:
-        page: Page instance
-        
-    Returns:
-        RegistrationPage instance
-    """
-    return RegistrationPage(page)
-
-
-@pytest.fixture(scope='function')
-def winvinaya_foundation_page(page: Page) -> WinVinayaFoundationPage:
-    """
-    Function-scoped WinVinayaFoundationPage fixture.
-    
-    Args:
-        page: Page instance
-        
-    Returns:
-        WinVinayaFoundationPage instance
-    """
-    return WinVinayaFoundationPage(page)
+    # Debug level: this autouse fixture fires for every test, so avoid the
+    # LogRecord and formatting cost at the default INFO level
+    if logger.isEnabledFor(logging.DEBUG):
+        test_name = request.node.name
+        logger.debug(f"Starting test: {test_name}")
+        yield
+        logger.debug(f"Finished test: {test_name}")
+    else:
+        yield
 
 
 # ============================================================================
@@ -247,28 +241,42 @@ def test_data():
     return project_config.test_data
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def valid_user():
     """
-    Function-scoped valid user fixture.
-    
+    Session-scoped valid user fixture.
+
+    The user data is an immutable snapshot from config, so one lookup
+    serves every scenario in the session.
+
     Returns:
         Valid user data
     """
     return project_config.get_test_user('valid')
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def invalid_user():
     """
-    Function-scoped invalid user fixture.
-    
+    Session-scoped invalid user fixture.
+
     Returns:
         Invalid user data
     """
     return project_config.get_test_user('invalid')
 
 
+@pytest.fixture(scope='session')
+def existing_user():
+    """
+    Session-scoped already-registered user fixture.
+
+    Returns:
+        Existing user data
+    """
+    return project_config.get_test_user('existing_user')
+
+
 # ============================================================================
 # Cleanup Hooks
 # ============================================================================
@@ -281,19 +289,26 @@ def pytest_sessionfinish(session, exitstatus):
         session: Pytest session
         exitstatus: Exit status code
     """
-    logger.info("=" * 80)
-    logger.info("TEST SESSION COMPLETED")
-    logger.info(f"Exit Status: {exitstatus}")
-    logger.info("=" * 80)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(_BANNER)
+        logger.info("TEST SESSION COMPLETED")
+        logger.info(f"Exit Status: {exitstatus}")
+        logger.info(_BANNER)
     
     # Generate CSV report
     if test_results:
-        csv_path = ReportHelper.generate_csv_report(test_results)
+        results = [
+            {'name': name, 'status': status, 'duration': duration, 'error': error}
+            for name, status, duration, error in test_results
+        ]
+        csv_path = ReportHelper.generate_csv_report(results)
         if csv_path:
             logger.info(f"Final CSV report created at: {csv_path}")
     
-    # Clean up old screenshots (older than 7 days)
-    try:
-        ScreenshotHelper.cleanup_old_screenshots(days=7)
-    except Exception as e:
-        logger.error(f"Failed to cleanup old screenshots: {str(e)}")
+    # Clean up old screenshots (older than 7 days) - once per run, not
+    # once per xdist worker
+    if not os.environ.get('PYTEST_XDIST_WORKER'):
+        try:
+            ScreenshotHelper.cleanup_old_screenshots(days=7)
+        except Exception as e:
+            logger.error(f"Failed to cleanup old screenshots: {str(e)}")
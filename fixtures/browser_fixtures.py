@@ -2,6 +2,7 @@
 Browser Fixtures Module
 Pytest fixtures for browser management
 """
+import os
 import pytest
 from typing import Generator
 from playwright.sync_api import Browser, BrowserContext, Page
@@ -13,6 +14,23 @@ from utils.logger import Logger
 logger = Logger.get_logger(__name__)
 
 
+# Config values used on the per-test fixture path, resolved once at import
+_BASE_URL = config.get_base_url()
+_TIMEOUT = config.get_timeout()
+_VIDEO = config.video
+# Under pytest-xdist each worker records into its own subfolder so workers
+# never contend on the same video files
+_WORKER_ID = os.environ.get('PYTEST_XDIST_WORKER')
+_VIDEOS_DIR = str(config.videos_dir / _WORKER_ID if _WORKER_ID else config.videos_dir)
+_BLOCK_RESOURCES = config.block_resources
+_REUSE_CONTEXT = config.reuse_context
+
+# Static assets re-downloaded on every navigation; identical across tests
+# and irrelevant to non-visual assertions, so runs that opt in
+# (BLOCK_RESOURCES=true) skip the bytes entirely
+_BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,mp4,webm}"
+
+
 @pytest.fixture(scope='session')
 def browser_manager() -> Generator[BrowserManager, None, None]:
     """
@@ -28,50 +46,86 @@ def browser_manager() -> Generator[BrowserManager, None, None]:
     manager.cleanup()
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def browser(browser_manager: BrowserManager) -> Generator[Browser, None, None]:
     """
-    Function-scoped browser fixture.
-    
+    Session-scoped browser fixture.
+
+    One browser serves the whole session; per-test isolation comes from
+    the function-scoped context fixture, and browser_manager.cleanup()
+    closes the browser at session end.
+
     Args:
         browser_manager: BrowserManager instance
-        
+
     Yields:
         Browser instance
     """
-    logger.info("Launching browser")
+    logger.info("Launching browser (session scope)")
     browser = browser_manager.launch_browser()
     yield browser
-    logger.info("Closing browser")
-    browser_manager.close_browser()
+
+
+# Shared context reused across scenarios when REUSE_CONTEXT=true; reset
+# (cookies/permissions/pages cleared) between tests instead of recreated
+_shared_context: dict = {'ctx': None}
+
+
+def _build_context_kwargs() -> dict:
+    """Build context construction options from the frozen config values."""
+    # Video recording must be configured at construction time - mutating
+    # the context options afterwards has no effect on a running context
+    ctx_kwargs = {
+        'viewport': {'width': 1920, 'height': 1080},
+        'ignore_https_errors': True,
+        'base_url': _BASE_URL
+    }
+
+    if _VIDEO in ('on', 'retain-on-failure', 'on_failure'):
+        ctx_kwargs['record_video_dir'] = _VIDEOS_DIR
+        ctx_kwargs['record_video_size'] = {'width': 1280, 'height': 720}
+
+    return ctx_kwargs
 
 
 @pytest.fixture(scope='function')
 def context(browser: Browser) -> Generator[BrowserContext, None, None]:
     """
     Function-scoped browser context fixture.
-    
+
+    With REUSE_CONTEXT=true one context serves the whole session and is
+    reset (cookies, permissions, pages) between scenarios - enough
+    isolation for most flows at a fraction of the create/close cost.
+
     Args:
         browser: Browser instance
-        
+
     Yields:
         BrowserContext instance
     """
+    if _REUSE_CONTEXT:
+        ctx = _shared_context['ctx']
+        if ctx is None:
+            logger.info("Creating shared browser context")
+            ctx = browser.new_context(**_build_context_kwargs())
+            _shared_context['ctx'] = ctx
+
+        yield ctx
+
+        ctx.clear_cookies()
+        try:
+            ctx.clear_permissions()
+        except Exception:
+            pass
+        for page in ctx.pages:
+            page.close()
+        return
+
     logger.info("Creating browser context")
-    
-    # Create context with base URL
-    ctx = browser.new_context(
-        viewport={'width': 1920, 'height': 1080},
-        ignore_https_errors=True,
-        base_url=config.get_base_url()
-    )
-    
-    # Configure video recording if enabled
-    if config.video in ['on', 'retain-on-failure', 'on_failure']:
-        ctx._impl_obj._options['record_video_dir'] = str(config.videos_dir)
-    
+    ctx = browser.new_context(**_build_context_kwargs())
+
     yield ctx
-    
+
     logger.info("Closing browser context")
     ctx.close()
 
@@ -90,8 +144,13 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     logger.info("Creating new page")
     
     page = context.new_page()
-    page.set_default_timeout(config.get_timeout())
-    
+    page.set_default_timeout(_TIMEOUT)
+
+    # Abort image/font/media requests for runs that don't need visuals -
+    # these bytes dominate page-load wall time and are identical per test
+    if _BLOCK_RESOURCES:
+        page.route(_BLOCKED_ASSETS, lambda route: route.abort())
+
     yield page
     
     logger.info("Closing page")
@@ -106,4 +165,4 @@ def base_url() -> str:
     Returns:
         Base URL from configuration
     """
-    return config.get_base_url()
+    return _BASE_URL
@@ -0,0 +1,104 @@
+"""
+Page Object Fixtures Module
+Pytest fixtures providing page object instances
+
+Page objects are constructed once per session and rebound to the current
+test's page via set_page, avoiding per-test re-instantiation.
+"""
+import pytest
+from playwright.sync_api import Page
+from pages.login_page import LoginPage
+from pages.home_page import HomePage
+from pages.registration_page import RegistrationPage
+from pages.winvinaya_foundation_page import WinVinayaFoundationPage
+
+
+@pytest.fixture(scope='session')
+def _login_page_instance() -> LoginPage:
+    """Session-scoped LoginPage instance, rebound per test."""
+    return LoginPage(None)
+
+
+@pytest.fixture(scope='session')
+def _home_page_instance() -> HomePage:
+    """Session-scoped HomePage instance, rebound per test."""
+    return HomePage(None)
+
+
+@pytest.fixture(scope='session')
+def _registration_page_instance() -> RegistrationPage:
+    """Session-scoped RegistrationPage instance, rebound per test."""
+    return RegistrationPage(None)
+
+
+@pytest.fixture(scope='session')
+def _winvinaya_foundation_page_instance() -> WinVinayaFoundationPage:
+    """Session-scoped WinVinayaFoundationPage instance, rebound per test."""
+    return WinVinayaFoundationPage(None)
+
+
+@pytest.fixture(scope='function')
+def login_page(_login_page_instance: LoginPage, page: Page) -> LoginPage:
+    """
+    Function-scoped LoginPage fixture.
+
+    Args:
+        _login_page_instance: Shared LoginPage instance
+        page: Page instance
+
+    Returns:
+        LoginPage instance bound to the current page
+    """
+    _login_page_instance.set_page(page)
+    return _login_page_instance
+
+
+@pytest.fixture(scope='function')
+def home_page(_home_page_instance: HomePage, page: Page) -> HomePage:
+    """
+    Function-scoped HomePage fixture.
+
+    Args:
+        _home_page_instance: Shared HomePage instance
+        page: Page instance
+
+    Returns:
+        HomePage instance bound to the current page
+    """
+    _home_page_instance.set_page(page)
+    return _home_page_instance
+
+
+@pytest.fixture(scope='function')
+def registration_page(_registration_page_instance: RegistrationPage, page: Page) -> RegistrationPage:
+    """
+    Function-scoped RegistrationPage fixture.
+
+    Args:
+        _registration_page_instance: Shared RegistrationPage instance
+        page: Page instance
+
+    Returns:
+        RegistrationPage instance bound to the current page
+    """
+    _registration_page_instance.set_page(page)
+    return _registration_page_instance
+
+
+@pytest.fixture(scope='function')
+def winvinaya_foundation_page(
+    _winvinaya_foundation_page_instance: WinVinayaFoundationPage,
+    page: Page
+) -> WinVinayaFoundationPage:
+    """
+    Function-scoped WinVinayaFoundationPage fixture.
+
+    Args:
+        _winvinaya_foundation_page_instance: Shared WinVinayaFoundationPage instance
+        page: Page instance
+
+    Returns:
+        WinVinayaFoundationPage instance bound to the current page
+    """
+    _winvinaya_foundation_page_instance.set_page(page)
+    return _winvinaya_foundation_page_instance
@@ -0,0 +1,201 @@
+"""
+Async Base Page Module
+Async mirror of BasePage for drivers that run pages concurrently
+
+The BDD suite itself stays on the sync API; this class exists for
+standalone scripts and load-style drivers that want to hide browser IPC
+latency behind one event loop, e.g.:
+
+    tasks = [page_object.login(email, password) for page_object in pages]
+    await asyncio.gather(*tasks)
+"""
+from typing import Optional
+from playwright.async_api import Page, Locator, expect
+from config.config import config
+from utils.logger import Logger
+
+
+logger = Logger.get_logger(__name__)
+
+
+class AsyncBasePage:
+    """
+    Async Base Page class containing common page operations.
+    Mirrors the public surface of BasePage using playwright.async_api.
+    """
+
+    def __init__(self, page: Page):
+        """
+        Initialize Async Base Page.
+
+        Args:
+            page: Playwright async Page instance
+        """
+        self.page = page
+        self.timeout = config.get_timeout()
+
+    # Navigation Methods
+
+    async def navigate_to(self, url: str) -> None:
+        """
+        Navigate to specified URL.
+
+        Args:
+            url: URL to navigate to
+        """
+        logger.info(f"Navigating to: {url}")
+        await self.page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
+
+    async def get_current_url(self) -> str:
+        """
+        Get current page URL.
+
+        Returns:
+            Current URL
+        """
+        return self.page.url
+
+    async def get_title(self) -> str:
+        """
+        Get page title.
+
+        Returns:
+            Page title
+        """
+        return await self.page.title()
+
+    async def reload_page(self) -> None:
+        """Reload current page."""
+        await self.page.reload(wait_until='domcontentloaded')
+
+    # Wait Methods
+
+    async def wait_for_element(self, selector: str, state: str = 'visible',
+                               timeout: Optional[int] = None) -> Locator:
+        """
+        Wait for element to reach specified state.
+
+        Args:
+            selector: Element selector
+            state: Element state (visible, hidden, attached, detached)
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            Locator instance
+        """
+        locator = self.page.locator(selector)
+        await locator.wait_for(state=state, timeout=timeout or self.timeout)
+        return locator
+
+    async def wait_for_url(self, url: str, timeout: Optional[int] = None) -> None:
+        """
+        Wait for URL to match pattern.
+
+        Args:
+            url: URL pattern to wait for
+            timeout: Custom timeout in milliseconds
+        """
+        await self.page.wait_for_url(url, timeout=timeout or self.timeout)
+
+    async def wait_for_load_state(self, state: str = 'load', timeout: Optional[int] = None) -> None:
+        """
+        Wait for page load state.
+
+        Args:
+            state: Load state (load, domcontentloaded, networkidle)
+            timeout: Custom timeout in milliseconds
+        """
+        await self.page.wait_for_load_state(state, timeout=timeout or self.timeout)
+
+    # Element Interaction Methods
+
+    async def click(self, selector: str, timeout: Optional[int] = None) -> None:
+        """
+        Click on element.
+
+        Args:
+            selector: Element selector
+            timeout: Custom timeout in milliseconds
+        """
+        await self.page.locator(selector).click(timeout=timeout or self.timeout)
+
+    async def fill(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
+        """
+        Fill input field with value.
+
+        Args:
+            selector: Element selector
+            value: Value to fill
+            timeout: Custom timeout in milliseconds
+        """
+        await self.page.locator(selector).fill(value, timeout=timeout or self.timeout)
+
+    async def select_option(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
+        """
+        Select option from dropdown.
+
+        Args:
+            selector: Element selector
+            value: Option value to select
+            timeout: Custom timeout in milliseconds
+        """
+        await self.page.locator(selector).select_option(value, timeout=timeout or self.timeout)
+
+    async def check(self, selector: str, timeout: Optional[int] = None) -> None:
+        """
+        Check checkbox or radio button.
+
+        Args:
+            selector: Element selector
+            timeout: Custom timeout in milliseconds
+        """
+        await self.page.locator(selector).check(timeout=timeout or self.timeout)
+
+    # Element Query Methods
+
+    async def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
+        """
+        Get text content of element.
+
+        Args:
+            selector: Element selector
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            Element text content
+        """
+        text = await self.page.locator(selector).text_content(timeout=timeout or self.timeout)
+        return text or ""
+
+    async def is_visible(self, selector: str) -> bool:
+        """
+        Check if element is visible (immediate, no waiting).
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            True if visible, False otherwise
+        """
+        return await self.page.locator(selector).is_visible()
+
+    # Assertion Methods
+
+    async def assert_element_visible(self, selector: str) -> None:
+        """
+        Assert that element is visible.
+
+        Args:
+            selector: Element selector
+        """
+        await expect(self.page.locator(selector)).to_be_visible(timeout=self.timeout)
+
+    async def assert_element_text(self, selector: str, expected: str) -> None:
+        """
+        Assert element text matches expected.
+
+        Args:
+            selector: Element selector
+            expected: Expected text
+        """
+        await expect(self.page.locator(selector)).to_have_text(expected, timeout=self.timeout)
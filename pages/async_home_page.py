@@ -0,0 +1,85 @@
+"""
+Async Home Page Module
+Async Page Object Model for the Home/Dashboard page
+"""
+import asyncio
+import re
+from playwright.async_api import Page, expect
+from config.config import config
+from pages.async_base_page import AsyncBasePage
+from pages.home_page import HomePage
+from utils.logger import Logger
+
+
+logger = Logger.get_logger(__name__)
+
+
+class AsyncHomePage(AsyncBasePage):
+    """Async Home Page Object class."""
+
+    # Reuse the sync page object's selectors so they stay in one place
+    WELCOME_MESSAGE = HomePage.WELCOME_MESSAGE
+    USER_PROFILE = HomePage.USER_PROFILE
+
+    def __init__(self, page: Page):
+        """
+        Initialize Async Home Page.
+
+        Args:
+            page: Playwright async Page instance
+        """
+        super().__init__(page)
+        self.url = f"{config.get_base_url()}{HomePage.PATH}"
+
+    async def navigate(self) -> None:
+        """Navigate to home page."""
+        logger.info("Navigating to home page")
+        await self.navigate_to(self.url)
+
+    async def _assert_url_is_home(self) -> bool:
+        """
+        Wait for the URL to land on dashboard/home.
+
+        Returns:
+            True if the URL check passed within the timeout
+        """
+        try:
+            await expect(self.page).to_have_url(
+                re.compile(r'/(dashboard|home)'), timeout=self.timeout
+            )
+            return True
+        except Exception:
+            return False
+
+    async def _assert_profile_visible(self) -> bool:
+        """
+        Wait for the user profile element to become visible.
+
+        Returns:
+            True if the visibility check passed within the timeout
+        """
+        try:
+            await expect(self.page.locator(self.USER_PROFILE)).to_be_visible(
+                timeout=self.timeout
+            )
+            return True
+        except Exception:
+            return False
+
+    async def verify_successful_login(self) -> bool:
+        """
+        Verify successful login by checking URL and profile concurrently.
+
+        The two assertions are independent, so their poll loops are
+        overlapped with asyncio.gather instead of run back to back.
+
+        Returns:
+            True if both checks passed
+        """
+        logger.info("Verifying successful login")
+        ok_url, ok_profile = await asyncio.gather(
+            self._assert_url_is_home(),
+            self._assert_profile_visible(),
+            return_exceptions=True
+        )
+        return ok_url is True and ok_profile is True
@@ -0,0 +1,56 @@
+"""
+Async Login Page Module
+Async Page Object Model for the Login page
+"""
+from playwright.async_api import Page
+from config.config import config
+from pages.async_base_page import AsyncBasePage
+from pages.login_page import LoginPage
+from utils.logger import Logger
+
+
+logger = Logger.get_logger(__name__)
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Async Login Page Object class."""
+
+    # Reuse the sync page object's selectors so they stay in one place
+    EMAIL_INPUT = LoginPage.EMAIL_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+
+    def __init__(self, page: Page):
+        """
+        Initialize Async Login Page.
+
+        Args:
+            page: Playwright async Page instance
+        """
+        super().__init__(page)
+        self.url = f"{config.get_base_url()}{LoginPage.PATH}"
+
+    async def navigate(self) -> None:
+        """Navigate to login page."""
+        logger.info("Navigating to login page")
+        await self.navigate_to(self.url)
+
+    async def login(self, email: str, password: str) -> None:
+        """
+        Perform login with credentials as one ordered pipeline.
+
+        Locators are resolved once up front, so the three awaited calls
+        carry no per-step locator construction or config lookups.
+
+        Args:
+            email: Email address
+            password: Password
+        """
+        logger.info("Logging in with email: %s", email)
+        email_input = self.page.locator(self.EMAIL_INPUT)
+        password_input = self.page.locator(self.PASSWORD_INPUT)
+        login_button = self.page.locator(self.LOGIN_BUTTON)
+
+        await email_input.fill(email, timeout=self.timeout)
+        await password_input.fill(password, timeout=self.timeout)
+        await login_button.click(timeout=self.timeout)
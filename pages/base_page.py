@@ -2,49 +2,113 @@
 Base Page Module
 Provides base page class with common page operations
 """
-from typing import Optional, List
+from typing import Dict, Optional, List
 from playwright.sync_api import Page, Locator, expect
 from config.config import config
 from utils.logger import Logger
-from utils.screenshot_helper import ScreenshotHelper
+from utils.screenshot_helper import screenshot_helper
 
 
 logger = Logger.get_logger(__name__)
 
 
+# Default timeout resolved once at import - page objects are constructed
+# per scenario, so avoid a config lookup on every construction
+_DEFAULT_TIMEOUT = config.get_timeout()
+
+# Whether error paths capture a screenshot before re-raising; disabling it
+# (SCREENSHOT_ON_ERROR=false) skips the PNG encode + disk write per failed
+# step, which adds up fast on flaky or retried runs
+_SCREENSHOT_ON_ERROR = config.screenshot_on_error
+
+
 class BasePage:
     """
     Base Page class containing common page operations.
     All page objects should inherit from this class.
     """
-    
-    def __init__(self, page: Page):
+
+    # Subclasses may declare a URL path (e.g. '/login'); it is appended to
+    # the configured base URL once at construction time
+    PATH: Optional[str] = None
+
+    def __init__(self, page: Optional[Page]):
         """
         Initialize Base Page.
-        
+
+        Args:
+            page: Playwright Page instance (may be None when the object is
+                constructed once per session and rebound via set_page)
+        """
+        self.timeout = _DEFAULT_TIMEOUT
+        self.screenshot_helper = screenshot_helper
+        self.base_url = config.get_base_url()
+        if self.PATH is not None:
+            self.url = f"{self.base_url}{self.PATH}"
+        self.set_page(page)
+
+    def set_page(self, page: Optional[Page]) -> None:
+        """
+        Rebind this page object to a new Playwright Page.
+
+        Allows page objects to be constructed once per session and reused
+        across tests with a fresh page bound before each one.
+
         Args:
             page: Playwright Page instance
         """
         self.page = page
-        self.timeout = config.get_timeout()
-        self.screenshot_helper = ScreenshotHelper()
-    
+        self._locator_cache: Dict[str, Locator] = {}
+
+    def _loc(self, selector: str) -> Locator:
+        """
+        Get a cached Locator for the given selector.
+
+        Locators are lazy element handles, so reusing one per selector is
+        safe; the cache is invalidated on navigation and page rebinds.
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            Locator instance
+        """
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+        return locator
+
+    def _invalidate_locators(self) -> None:
+        """Clear the locator cache after a DOM-replacing navigation."""
+        self._locator_cache.clear()
+
     # Navigation Methods
     
-    def navigate_to(self, url: str) -> None:
+    def navigate_to(self, url: str, wait_until: str = 'commit') -> None:
         """
         Navigate to specified URL.
-        
+
+        Defaults to wait_until='commit', which returns as soon as the
+        navigation is committed instead of blocking on a full DOM parse;
+        subsequent locator actions and web-first assertions do their own
+        waiting. Page objects that genuinely need a later lifecycle signal
+        pass it explicitly (e.g. wait_until='load' for pages whose form JS
+        must have run).
+
         Args:
             url: URL to navigate to
+            wait_until: Lifecycle event to wait for
+                (commit, domcontentloaded, load, networkidle)
         """
         try:
-            logger.info(f"Navigating to: {url}")
-            self.page.goto(url, wait_until='domcontentloaded', timeout=self.timeout)
-            logger.info(f"Successfully navigated to: {url}")
+            logger.info("Navigating to: %s", url)
+            self.page.goto(url, wait_until=wait_until, timeout=self.timeout)
+            self._invalidate_locators()
+            logger.info("Successfully navigated to: %s", url)
         except Exception as e:
-            logger.error(f"Failed to navigate to {url}: {str(e)}")
-            self.screenshot_helper.capture_screenshot(self.page, f"navigation_error_{url.split('/')[-1]}")
+            logger.error("Failed to navigate to %s: %s", url, str(e))
+            if _SCREENSHOT_ON_ERROR:
+                self.screenshot_helper.capture_screenshot(self.page, f"navigation_error_{url.split('/')[-1]}")
             raise
     
     def get_current_url(self) -> str:
@@ -55,7 +119,7 @@ class BasePage:
             Current URL
         """
         url = self.page.url
-        logger.debug(f"Current URL: {url}")
+        logger.debug("Current URL: %s", url)
         return url
     
     def get_title(self) -> str:
@@ -66,23 +130,26 @@ class BasePage:
             Page title
         """
         title = self.page.title()
-        logger.debug(f"Page title: {title}")
+        logger.debug("Page title: %s", title)
         return title
     
     def reload_page(self) -> None:
         """Reload current page."""
         logger.info("Reloading page")
         self.page.reload(wait_until='domcontentloaded')
+        self._invalidate_locators()
     
     def go_back(self) -> None:
         """Navigate back in browser history."""
         logger.info("Navigating back")
         self.page.go_back(wait_until='domcontentloaded')
+        self._invalidate_locators()
     
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
         logger.info("Navigating forward")
         self.page.go_forward(wait_until='domcontentloaded')
+        self._invalidate_locators()
     
     # Wait Methods
     
@@ -100,13 +167,14 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         try:
-            logger.debug(f"Waiting for element: {selector} (state: {state})")
-            locator = self.page.locator(selector)
+            logger.debug("Waiting for element: %s (state: %s)", selector, state)
+            locator = self._loc(selector)
             locator.wait_for(state=state, timeout=timeout)
             return locator
         except Exception as e:
-            logger.error(f"Element not found: {selector} - {str(e)}")
-            self.screenshot_helper.capture_screenshot(self.page, f"element_not_found")
+            logger.error("Element not found: %s - %s", selector, str(e))
+            if _SCREENSHOT_ON_ERROR:
+                self.screenshot_helper.capture_screenshot(self.page, f"element_not_found")
             raise
     
     def wait_for_url(self, url: str, timeout: Optional[int] = None) -> None:
@@ -119,11 +187,11 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         try:
-            logger.debug(f"Waiting for URL: {url}")
+            logger.debug("Waiting for URL: %s", url)
             self.page.wait_for_url(url, timeout=timeout)
-            logger.info(f"URL matched: {url}")
+            logger.info("URL matched: %s", url)
         except Exception as e:
-            logger.error(f"URL did not match {url}: {str(e)}")
+            logger.error("URL did not match %s: %s", url, str(e))
             raise
     
     def wait_for_load_state(self, state: str = 'load', timeout: Optional[int] = None) -> None:
@@ -135,7 +203,7 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.debug(f"Waiting for load state: {state}")
+        logger.debug("Waiting for load state: %s", state)
         self.page.wait_for_load_state(state, timeout=timeout)
     
     def wait_for_timeout(self, timeout: int) -> None:
@@ -145,7 +213,7 @@ class BasePage:
         Args:
             timeout: Timeout in milliseconds
         """
-        logger.debug(f"Waiting for {timeout}ms")
+        logger.debug("Waiting for %sms", timeout)
         self.page.wait_for_timeout(timeout)
     
     # Element Interaction Methods
@@ -160,13 +228,14 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         try:
-            logger.info(f"Clicking element: {selector}")
-            locator = self.page.locator(selector)
+            logger.info("Clicking element: %s", selector)
+            locator = self._loc(selector)
             locator.click(timeout=timeout)
-            logger.info(f"Successfully clicked: {selector}")
+            logger.info("Successfully clicked: %s", selector)
         except Exception as e:
-            logger.error(f"Failed to click {selector}: {str(e)}")
-            self.screenshot_helper.capture_screenshot(self.page, f"click_error")
+            logger.error("Failed to click %s: %s", selector, str(e))
+            if _SCREENSHOT_ON_ERROR:
+                self.screenshot_helper.capture_screenshot(self.page, f"click_error")
             raise
     
     def double_click(self, selector: str, timeout: Optional[int] = None) -> None:
@@ -178,8 +247,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Double clicking element: {selector}")
-        self.page.locator(selector).dblclick(timeout=timeout)
+        logger.info("Double clicking element: %s", selector)
+        self._loc(selector).dblclick(timeout=timeout)
     
     def fill(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
         """
@@ -192,28 +261,33 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         try:
-            logger.info(f"Filling element {selector} with value: {value}")
-            locator = self.page.locator(selector)
+            logger.info("Filling element %s with value: %s", selector, value)
+            locator = self._loc(selector)
             locator.fill(value, timeout=timeout)
-            logger.info(f"Successfully filled: {selector}")
+            logger.info("Successfully filled: %s", selector)
         except Exception as e:
-            logger.error(f"Failed to fill {selector}: {str(e)}")
-            self.screenshot_helper.capture_screenshot(self.page, f"fill_error")
+            logger.error("Failed to fill %s: %s", selector, str(e))
+            if _SCREENSHOT_ON_ERROR:
+                self.screenshot_helper.capture_screenshot(self.page, f"fill_error")
             raise
     
-    def type(self, selector: str, text: str, delay: int = 100, timeout: Optional[int] = None) -> None:
+    def type(self, selector: str, text: str, delay: int = 0, timeout: Optional[int] = None) -> None:
         """
-        Type text into element with delay.
-        
+        Type text into element key by key.
+
+        Prefer fill() unless the app listens to per-key events. A non-zero
+        delay is only needed for JS-driven input (typeahead, IME) - the old
+        100ms default added n-chars x 100ms of artificial wait per call.
+
         Args:
             selector: Element selector
             text: Text to type
-            delay: Delay between keystrokes in milliseconds
+            delay: Delay between keystrokes in milliseconds (opt-in)
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Typing into element: {selector}")
-        self.page.locator(selector).type(text, delay=delay, timeout=timeout)
+        logger.info("Typing into element: %s", selector)
+        self._loc(selector).type(text, delay=delay, timeout=timeout)
     
     def clear(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -224,8 +298,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Clearing element: {selector}")
-        self.page.locator(selector).clear(timeout=timeout)
+        logger.info("Clearing element: %s", selector)
+        self._loc(selector).clear(timeout=timeout)
     
     def select_option(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
         """
@@ -237,8 +311,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Selecting option {value} in {selector}")
-        self.page.locator(selector).select_option(value, timeout=timeout)
+        logger.info("Selecting option %s in %s", value, selector)
+        self._loc(selector).select_option(value, timeout=timeout)
     
     def check(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -249,8 +323,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Checking element: {selector}")
-        self.page.locator(selector).check(timeout=timeout)
+        logger.info("Checking element: %s", selector)
+        self._loc(selector).check(timeout=timeout)
     
     def uncheck(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -261,8 +335,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Unchecking element: {selector}")
-        self.page.locator(selector).uncheck(timeout=timeout)
+        logger.info("Unchecking element: %s", selector)
+        self._loc(selector).uncheck(timeout=timeout)
     
     def hover(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -273,8 +347,8 @@ class BasePage:
             timeout: Custom timeout in milliseconds
         """
         timeout = timeout or self.timeout
-        logger.info(f"Hovering over element: {selector}")
-        self.page.locator(selector).hover(timeout=timeout)
+        logger.info("Hovering over element: %s", selector)
+        self._loc(selector).hover(timeout=timeout)
     
     # Element Query Methods
     
@@ -290,8 +364,8 @@ class BasePage:
             Element text content
         """
         timeout = timeout or self.timeout
-        text = self.page.locator(selector).text_content(timeout=timeout)
-        logger.debug(f"Text from {selector}: {text}")
+        text = self._loc(selector).text_content(timeout=timeout)
+        logger.debug("Text from %s: %s", selector, text)
         return text or ""
     
     def get_attribute(self, selector: str, attribute: str, timeout: Optional[int] = None) -> Optional[str]:
@@ -307,8 +381,8 @@ class BasePage:
             Attribute value
         """
         timeout = timeout or self.timeout
-        value = self.page.locator(selector).get_attribute(attribute, timeout=timeout)
-        logger.debug(f"Attribute {attribute} from {selector}: {value}")
+        value = self._loc(selector).get_attribute(attribute, timeout=timeout)
+        logger.debug("Attribute %s from %s: %s", attribute, selector, value)
         return value
     
     def is_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
@@ -324,12 +398,40 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         try:
-            visible = self.page.locator(selector).is_visible(timeout=timeout)
-            logger.debug(f"Element {selector} visible: {visible}")
+            visible = self._loc(selector).is_visible(timeout=timeout)
+            logger.debug("Element %s visible: %s", selector, visible)
             return visible
         except:
             return False
     
+    def is_present_now(self, selector: str) -> bool:
+        """
+        Immediately check if element exists and is visible, without waiting.
+
+        Unlike is_visible with a timeout, a negative answer returns in
+        milliseconds instead of blocking for the full timeout.
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            True if element is present and visible right now
+        """
+        locator = self._loc(selector)
+        return locator.count() > 0 and locator.is_visible()
+
+    def exists(self, selector: str) -> bool:
+        """
+        Immediately check if element is attached to the DOM, without waiting.
+
+        Args:
+            selector: Element selector
+
+        Returns:
+            True if at least one matching element exists right now
+        """
+        return self._loc(selector).count() > 0
+
     def is_enabled(self, selector: str, timeout: Optional[int] = None) -> bool:
         """
         Check if element is enabled.
@@ -342,8 +444,8 @@ class BasePage:
             True if enabled, False otherwise
         """
         timeout = timeout or self.timeout
-        enabled = self.page.locator(selector).is_enabled(timeout=timeout)
-        logger.debug(f"Element {selector} enabled: {enabled}")
+        enabled = self._loc(selector).is_enabled(timeout=timeout)
+        logger.debug("Element %s enabled: %s", selector, enabled)
         return enabled
     
     def is_checked(self, selector: str, timeout: Optional[int] = None) -> bool:
@@ -358,8 +460,8 @@ class BasePage:
             True if checked, False otherwise
         """
         timeout = timeout or self.timeout
-        checked = self.page.locator(selector).is_checked(timeout=timeout)
-        logger.debug(f"Element {selector} checked: {checked}")
+        checked = self._loc(selector).is_checked(timeout=timeout)
+        logger.debug("Element %s checked: %s", selector, checked)
         return checked
     
     def get_element_count(self, selector: str) -> int:
@@ -372,8 +474,8 @@ class BasePage:
         Returns:
             Number of matching elements
         """
-        count = self.page.locator(selector).count()
-        logger.debug(f"Element count for {selector}: {count}")
+        count = self._loc(selector).count()
+        logger.debug("Element count for %s: %s", selector, count)
         return count
     
     # Screenshot Methods
@@ -406,7 +508,7 @@ class BasePage:
         Args:
             expected: Expected text in URL
         """
-        logger.info(f"Asserting URL contains: {expected}")
+        logger.info("Asserting URL contains: %s", expected)
         expect(self.page).to_have_url(expected, timeout=self.timeout)
     
     def assert_title_contains(self, expected: str) -> None:
@@ -416,9 +518,22 @@ class BasePage:
         Args:
             expected: Expected text in title
         """
-        logger.info(f"Asserting title contains: {expected}")
+        logger.info("Asserting title contains: %s", expected)
         expect(self.page).to_have_title(expected, timeout=self.timeout)
     
+    def assert_visible_within(self, selector: str, timeout: Optional[int] = None) -> None:
+        """
+        Assert that element becomes visible within the timeout.
+
+        Polls via Playwright's web-first expect, returning as soon as the
+        element is visible rather than waiting out a fixed probe timeout.
+
+        Args:
+            selector: Element selector
+            timeout: Custom timeout in milliseconds
+        """
+        expect(self._loc(selector)).to_be_visible(timeout=timeout or self.timeout)
+
     def assert_element_visible(self, selector: str) -> None:
         """
         Assert that element is visible.
@@ -426,8 +541,8 @@ class BasePage:
         Args:
             selector: Element selector
         """
-        logger.info(f"Asserting element visible: {selector}")
-        expect(self.page.locator(selector)).to_be_visible(timeout=self.timeout)
+        logger.info("Asserting element visible: %s", selector)
+        expect(self._loc(selector)).to_be_visible(timeout=self.timeout)
     
     def assert_element_text(self, selector: str, expected: str) -> None:
         """
@@ -437,5 +552,5 @@ class BasePage:
             selector: Element selector
             expected: Expected text
         """
-        logger.info(f"Asserting element {selector} has text: {expected}")
-        expect(self.page.locator(selector)).to_have_text(expected, timeout=self.timeout)
+        logger.info("Asserting element %s has text: %s", selector, expected)
+        expect(self._loc(selector)).to_have_text(expected, timeout=self.timeout)
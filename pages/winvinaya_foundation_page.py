@@ -2,6 +2,8 @@
 WinVinaya Foundation Page Module
 Page object for WinVinaya Foundation website
 """
+import re
+from playwright.sync_api import expect
 from pages.base_page import BasePage
 from utils.logger import Logger
 
@@ -35,9 +37,10 @@ class WinVinayaFoundationPage(BasePage):
     
     def navigate(self) -> None:
         """Navigate to WinVinaya Foundation website."""
-        logger.info(f"Navigating to WinVinaya Foundation: {self.URL}")
-        self.navigate_to(self.URL)
-        self.wait_for_load_state('domcontentloaded')
+        logger.info("Navigating to WinVinaya Foundation: %s", self.URL)
+        # goto already awaits domcontentloaded here - no second
+        # wait_for_load_state needed, and no full-load/networkidle wait
+        self.navigate_to(self.URL, wait_until='domcontentloaded')
         logger.info("Successfully navigated to WinVinaya Foundation")
     
     def is_page_loaded(self) -> bool:
@@ -51,10 +54,10 @@ class WinVinayaFoundationPage(BasePage):
             # Wait for content to be loaded
             self.wait_for_load_state('domcontentloaded', timeout=10000)
             title = self.get_title()
-            logger.info(f"Page loaded. Current title: '{title}'")
+            logger.info("Page loaded. Current title: '%s'", title)
             return True
         except Exception as e:
-            logger.error(f"Page not loaded properly: {str(e)}")
+            logger.error("Page not loaded properly: %s", str(e))
             return False
     
     def get_page_title(self) -> str:
@@ -64,10 +67,11 @@ class WinVinayaFoundationPage(BasePage):
         Returns:
             Page title as string
         """
-        # Wait for title to be populated
-        self.page.wait_for_function("document.title !== ''", timeout=5000)
+        # Wait for title to be populated - native protocol-level polling,
+        # no injected JS evaluation per tick
+        expect(self.page).to_have_title(re.compile(r'.+'), timeout=5000)
         title = self.get_title()
-        logger.info(f"Page title: {title}")
+        logger.info("Page title: %s", title)
         return title
     
     def is_page_title_present(self) -> bool:
@@ -79,7 +83,7 @@ class WinVinayaFoundationPage(BasePage):
         """
         title = self.get_page_title()
         is_present = bool(title and len(title.strip()) > 0)
-        logger.info(f"Page title present: {is_present}")
+        logger.info("Page title present: %s", is_present)
         return is_present
     
     def verify_title_contains(self, expected_text: str) -> bool:
@@ -94,7 +98,7 @@ class WinVinayaFoundationPage(BasePage):
         """
         title = self.get_page_title()
         contains = expected_text.lower() in title.lower()
-        logger.info(f"Title '{title}' contains '{expected_text}': {contains}")
+        logger.info("Title '%s' contains '%s': %s", title, expected_text, contains)
         return contains
     
     def is_main_heading_visible(self) -> bool:
@@ -105,7 +109,8 @@ class WinVinayaFoundationPage(BasePage):
             True if visible, False otherwise
         """
         try:
-            return self.is_visible(self.MAIN_HEADING, timeout=5000)
+            # Zero-wait snapshot - the absent case returns immediately
+            return self.is_present_now(self.MAIN_HEADING)
         except:
             return False
     
@@ -117,15 +122,12 @@ class WinVinayaFoundationPage(BasePage):
             Joined text of all H1 elements
         """
         try:
-            headings = self.page.locator(self.MAIN_HEADING)
-            count = headings.count()
-            texts = []
-            for i in range(count):
-                texts.append(headings.nth(i).inner_text())
-            
+            # Fetch every matching heading's text in one protocol call
+            # instead of a count() plus one round-trip per element
+            texts = self.page.locator(self.MAIN_HEADING).all_inner_texts()
             combined_text = " ".join(texts)
-            logger.info(f"Combined H1 text: {combined_text}")
+            logger.info("Combined H1 text: %s", combined_text)
             return combined_text
         except Exception as e:
-            logger.error(f"Failed to get main heading text: {str(e)}")
+            logger.error("Failed to get main heading text: %s", str(e))
             return ""
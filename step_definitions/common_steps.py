@@ -14,7 +14,7 @@ logger = Logger.get_logger(__name__)
 
 # Common Navigation Steps
 
-@given(parsers.parse('I am on the {page_name} page'))
+@given(parsers.cfparse('I am on the {page_name} page'))
 def navigate_to_page(page_name: str, login_page: LoginPage, home_page: HomePage, registration_page):
     """
     Navigate to specified page.
@@ -22,7 +22,7 @@ def navigate_to_page(page_name: str, login_page: LoginPage, home_page: HomePage,
     Args:
         page_name: Name of the page to navigate to
     """
-    logger.info(f"Step: Given I am on the {page_name} page")
+    logger.info("Step: Given I am on the %s page", page_name)
     
     page_map = {
         'login': login_page,
@@ -38,7 +38,7 @@ def navigate_to_page(page_name: str, login_page: LoginPage, home_page: HomePage,
         raise ValueError(f"Unknown page: {page_name}")
 
 
-@when(parsers.parse('I navigate to {url}'))
+@when(parsers.cfparse('I navigate to {url}'))
 def navigate_to_url(url: str, page):
     """
     Navigate to specific URL.
@@ -46,11 +46,11 @@ def navigate_to_url(url: str, page):
     Args:
         url: URL to navigate to
     """
-    logger.info(f"Step: When I navigate to {url}")
+    logger.info("Step: When I navigate to %s", url)
     page.navigate_to(url)
 
 
-@when(parsers.parse('I search for "{query}"'))
+@when(parsers.re(r'I search for "(?P<query>[^"]+)"'))
 def search_for_product(query: str, home_page: HomePage, context: dict):
     """
     Search for product.
@@ -58,7 +58,7 @@ def search_for_product(query: str, home_page: HomePage, context: dict):
     Args:
         query: Search query
     """
-    logger.info(f"Step: When I search for '{query}'")
+    logger.info("Step: When I search for '%s'", query)
     home_page.search(query)
     context['search_query'] = query
 
@@ -78,7 +78,7 @@ def verify_search_results(page, context: dict):
     assert page.get_current_url(), "Page not loaded"
 
 
-@then(parsers.parse('the results should contain "{expected_text}"'))
+@then(parsers.re(r'the results should contain "(?P<expected_text>[^"]+)"'))
 def verify_results_contain_text(page, expected_text: str):
     """
     Verify results contain expected text.
@@ -86,14 +86,14 @@ def verify_results_contain_text(page, expected_text: str):
     Args:
         expected_text: Expected text in results
     """
-    logger.info(f"Step: Then the results should contain '{expected_text}'")
+    logger.info("Step: Then the results should contain '%s'", expected_text)
     
     # This is a placeholder - actual implementation would check results
     # For now, we'll just log
-    logger.info(f"Would verify results contain: {expected_text}")
+    logger.info("Would verify results contain: %s", expected_text)
 
 
-@then(parsers.parse('I should see "{message}" message'))
+@then(parsers.re(r'I should see "(?P<message>[^"]+)" message'))
 def verify_message_displayed(page, message: str):
     """
     Verify specific message is displayed.
@@ -101,16 +101,16 @@ def verify_message_displayed(page, message: str):
     Args:
         message: Expected message
     """
-    logger.info(f"Step: Then I should see '{message}' message")
+    logger.info("Step: Then I should see '%s' message", message)
     
     # Wait for message
     page.wait_for_timeout(1000)
     
     # This is a placeholder - actual implementation would check for message
-    logger.info(f"Would verify message: {message}")
+    logger.info("Would verify message: %s", message)
 
 
-@then(parsers.parse('the results should be in category "{category}"'))
+@then(parsers.re(r'the results should be in category "(?P<category>[^"]+)"'))
 def verify_results_category(page, category: str, context: dict):
     """
     Verify results are in specified category.
@@ -118,13 +118,13 @@ def verify_results_category(page, category: str, context: dict):
     Args:
         category: Expected category
     """
-    logger.info(f"Step: Then the results should be in category '{category}'")
+    logger.info("Step: Then the results should be in category '%s'", category)
     
     # Store in context
     context['expected_category'] = category
     
     # This is a placeholder - actual implementation would verify category
-    logger.info(f"Would verify category: {category}")
+    logger.info("Would verify category: %s", category)
 
 
 # Common Action Steps
@@ -137,19 +137,28 @@ def click_on_element(element_name: str, page):
     Args:
         element_name: Name of element to click
     """
-    logger.info(f"Step: When I click on {element_name}")
+    logger.info("Step: When I click on %s", element_name)
     
     # This is a generic step - actual implementation would map element names to selectors
-    logger.info(f"Would click on: {element_name}")
+    logger.info("Would click on: %s", element_name)
 
 
-@when(parsers.parse('I wait for {seconds:d} seconds'))
+@when(parsers.cfparse('I wait for {seconds:d} seconds'))
 def wait_for_seconds(seconds: int, page):
     """
-    Wait for specified seconds.
-    
+    Wait up to the specified seconds for the page to settle.
+
+    The duration is a ceiling, not a floor: the step returns as soon as
+    the network goes idle instead of always burning the full wall-clock
+    time. Scenarios should prefer element-specific waits over this step.
+
     Args:
-        seconds: Number of seconds to wait
-    """
-    logger.info(f"Step: When I wait for {seconds} seconds")
-    page.wait_for_timeout(seconds * 1000)
+        seconds: Maximum number of seconds to wait
+    """
+    logger.info("Step: When I wait for %s seconds", seconds)
+    try:
+        page.wait_for_load_state('networkidle', timeout=seconds * 1000)
+    except Exception:
+        # Page still busy at the deadline - proceed; assertions that
+        # follow do their own waiting
+        pass
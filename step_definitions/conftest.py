@@ -1,10 +1,23 @@
 """
 Step Definitions Conftest
 Configuration and fixtures for step definitions
+
+Browser lifecycle fixtures live in fixtures.browser_fixtures (loaded from
+the root conftest): one Browser per session, one BrowserContext + Page per
+scenario - context creation is orders of magnitude cheaper than a browser
+launch, so scenarios stay isolated without paying the launch cost each.
 """
+import itertools
 import pytest
 from pytest_bdd import given, when, then, parsers
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+from utils.data_reader import fake_data_generator
+
+
+# Next unused slot in this worker's user pool; each draw is unique, so no
+# two scenarios (or reruns of one) ever share a fake user
+_user_counter = itertools.count()
 
 
 # Shared context for scenarios
@@ -12,8 +25,44 @@ from typing import Dict, Any
 def shared_context() -> Dict[str, Any]:
     """
     Shared context dictionary for storing data between steps.
-    
+
     Returns:
         Empty dictionary for shared context
     """
     return {}
+
+
+@pytest.fixture(scope='session')
+def user_pool() -> List[Dict[str, Any]]:
+    """
+    Session-scoped pool of pre-generated fake users.
+
+    Faker calls (locale loading, provider draws) are paid once per worker
+    here instead of once per scenario.
+
+    Returns:
+        List of generated user dicts
+    """
+    return [fake_data_generator.generate_user() for _ in range(128)]
+
+
+@pytest.fixture
+def fresh_user(user_pool) -> Dict[str, Any]:
+    """
+    Per-scenario user drawn from the pre-generated pool.
+
+    Each draw takes the next unused slot, so every scenario - including
+    reruns via pytest-rerunfailures - gets a user nobody has registered
+    before; once the pool runs out, users are generated on demand. The
+    caller gets a copy it may freely mutate.
+
+    Args:
+        user_pool: Session-scoped pool of fake users
+
+    Returns:
+        Copy of a generated user dict
+    """
+    index = next(_user_counter)
+    if index < len(user_pool):
+        return dict(user_pool[index])
+    return fake_data_generator.generate_user()
@@ -3,10 +3,10 @@ Login Step Definitions
 BDD step implementations for login feature
 """
 import pytest
+from playwright.sync_api import expect
 from pytest_bdd import scenarios, given, when, then, parsers
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
-from config.config import config
 from utils.logger import Logger
 
 
@@ -27,19 +27,16 @@ def navigate_to_login_page(login_page: LoginPage):
 
 
 @given('I am logged in')
-def user_is_logged_in(login_page: LoginPage, home_page: HomePage):
+def user_is_logged_in(login_page: LoginPage, home_page: HomePage, valid_user: dict):
     """Login with valid credentials."""
     logger.info("Step: Given I am logged in")
-    
-    # Get valid user credentials
-    user = config.get_test_user('valid')
-    
+
     # Navigate to login page
     login_page.navigate()
-    
-    # Perform login
-    login_page.login(user['email'], user['password'])
-    
+
+    # Perform login with the session-cached credentials
+    login_page.login(valid_user['email'], valid_user['password'])
+
     # Verify login successful
     assert home_page.verify_successful_login(), "Login failed"
 
@@ -47,18 +44,15 @@ def user_is_logged_in(login_page: LoginPage, home_page: HomePage):
 # When Steps
 
 @when('I login with valid credentials')
-def login_with_valid_credentials(login_page: LoginPage):
+def login_with_valid_credentials(login_page: LoginPage, valid_user: dict):
     """Login with valid credentials."""
     logger.info("Step: When I login with valid credentials")
-    
-    # Get valid user credentials
-    user = config.get_test_user('valid')
-    
-    # Perform login
-    login_page.login(user['email'], user['password'])
+
+    # Perform login with the session-cached credentials
+    login_page.login(valid_user['email'], valid_user['password'])
 
 
-@when(parsers.parse('I enter email "{email}" and password "{password}"'))
+@when(parsers.re(r'I enter email "(?P<email>[^"]*)" and password "(?P<password>[^"]*)"'))
 def enter_email_and_password(login_page: LoginPage, email: str, password: str):
     """
     Enter email and password.
@@ -67,7 +61,7 @@ def enter_email_and_password(login_page: LoginPage, email: str, password: str):
         email: Email address
         password: Password
     """
-    logger.info(f"Step: When I enter email '{email}' and password")
+    logger.info("Step: When I enter email '%s' and password", email)
     
     if email:
         login_page.enter_email(email)
@@ -106,7 +100,7 @@ def verify_welcome_message(home_page: HomePage):
     assert home_page.is_welcome_message_displayed(), "Welcome message not displayed"
 
 
-@then(parsers.parse('I should see error message "{error_message}"'))
+@then(parsers.re(r'I should see error message "(?P<error_message>[^"]+)"'))
 def verify_error_message(login_page: LoginPage, error_message: str, context: dict):
     """
     Verify error message is displayed.
@@ -114,14 +108,12 @@ def verify_error_message(login_page: LoginPage, error_message: str, context: dic
     Args:
         error_message: Expected error message
     """
-    logger.info(f"Step: Then I should see error message '{error_message}'")
-    
-    # Wait a bit for error message to appear
-    login_page.wait_for_timeout(1000)
-    
-    # Check if error message is displayed
-    assert login_page.is_error_message_displayed(), f"Error message not displayed"
-    
+    logger.info("Step: Then I should see error message '%s'", error_message)
+
+    # Auto-waiting assertion returns as soon as the error shows instead of
+    # sleeping a fixed interval first
+    expect(login_page.error_locator()).to_be_visible(timeout=5000)
+
     # Get actual error message
     actual_message = login_page.get_error_message()
     
@@ -137,9 +129,13 @@ def verify_error_message(login_page: LoginPage, error_message: str, context: dic
 def verify_redirected_to_login_page(login_page: LoginPage):
     """Verify redirection to login page."""
     logger.info("Step: Then I should be redirected to login page")
-    
-    # Wait for redirect
-    login_page.wait_for_timeout(2000)
-    
+
+    # Event-driven: return as soon as the URL lands on /login instead of
+    # sleeping through a fixed redirect window
+    try:
+        login_page.page.wait_for_url('**/login**', timeout=5000)
+    except Exception:
+        pass
+
     # Verify on login page
     assert login_page.is_on_login_page(), "Not redirected to login page"
@@ -2,12 +2,12 @@
 Registration Step Definitions
 BDD step implementations for registration feature
 """
+import re
 import pytest
+from playwright.sync_api import expect
 from pytest_bdd import scenarios, given, when, then, parsers
 from pages.registration_page import RegistrationPage
-from config.config import config
 from utils.logger import Logger
-from utils.data_reader import fake_data_generator
 
 
 logger = Logger.get_logger(__name__)
@@ -16,6 +16,10 @@ logger = Logger.get_logger(__name__)
 scenarios('../features/registration.feature')
 
 
+# URLs the app may redirect to after a successful registration
+_SUCCESS_URL_RE = re.compile(r'login|dashboard')
+
+
 # Given Steps
 
 @given('I am on the registration page')
@@ -29,12 +33,13 @@ def navigate_to_registration_page(registration_page: RegistrationPage):
 # When Steps
 
 @when('I fill in the registration form with valid data')
-def fill_registration_form_with_valid_data(registration_page: RegistrationPage, context: dict):
+def fill_registration_form_with_valid_data(registration_page: RegistrationPage, context: dict,
+                                          fresh_user: dict):
     """Fill registration form with valid data."""
     logger.info("Step: When I fill in the registration form with valid data")
-    
-    # Generate fake user data
-    user_data = fake_data_generator.generate_user()
+
+    # Draw pre-generated user data from the session pool
+    user_data = fresh_user
     
     # Store in context for later use
     context['registration_data'] = user_data
@@ -51,16 +56,14 @@ def submit_registration_form(registration_page: RegistrationPage):
 
 
 @when('I register with an already registered email')
-def register_with_existing_email(registration_page: RegistrationPage, context: dict):
+def register_with_existing_email(registration_page: RegistrationPage, context: dict,
+                                 existing_user: dict, fresh_user: dict):
     """Register with existing email."""
     logger.info("Step: When I register with an already registered email")
-    
-    # Get existing user data
-    user = config.get_test_user('existing_user')
-    
-    # Generate new user data but use existing email
-    user_data = fake_data_generator.generate_user()
-    user_data['email'] = user['email']
+
+    # Use pooled user data with the session-cached existing email
+    user_data = fresh_user
+    user_data['email'] = existing_user['email']
     
     # Store in context
     context['registration_data'] = user_data
@@ -71,12 +74,13 @@ def register_with_existing_email(registration_page: RegistrationPage, context: d
 
 
 @when('I enter invalid email format')
-def enter_invalid_email_format(registration_page: RegistrationPage, context: dict):
+def enter_invalid_email_format(registration_page: RegistrationPage, context: dict,
+                               fresh_user: dict):
     """Enter invalid email format."""
     logger.info("Step: When I enter invalid email format")
-    
-    # Generate user data with invalid email
-    user_data = fake_data_generator.generate_user()
+
+    # Pooled user data with an invalid email
+    user_data = fresh_user
     user_data['email'] = 'invalid-email-format'
     
     # Store in context
@@ -87,12 +91,13 @@ def enter_invalid_email_format(registration_page: RegistrationPage, context: dic
 
 
 @when('I enter a weak password')
-def enter_weak_password(registration_page: RegistrationPage, context: dict):
+def enter_weak_password(registration_page: RegistrationPage, context: dict,
+                        fresh_user: dict):
     """Enter weak password."""
     logger.info("Step: When I enter a weak password")
-    
-    # Generate user data with weak password
-    user_data = fake_data_generator.generate_user()
+
+    # Pooled user data with a weak password
+    user_data = fresh_user
     user_data['password'] = '123'  # Weak password
     
     # Store in context
@@ -108,11 +113,18 @@ def enter_weak_password(registration_page: RegistrationPage, context: dict):
 def verify_registration_success_message(registration_page: RegistrationPage):
     """Verify registration success message."""
     logger.info("Step: Then I should see registration success message")
-    
-    # Wait for success message
-    registration_page.wait_for_timeout(2000)
-    
-    # Verify success
+
+    # verify_registration_success is a zero-wait snapshot, so wait for the
+    # outcome first: the app either redirects to login/dashboard or renders
+    # the success message in place. Wait for the redirect, and if it never
+    # comes, fall back to the auto-waiting message assertion.
+    if not registration_page.verify_registration_success():
+        try:
+            registration_page.page.wait_for_url(_SUCCESS_URL_RE, timeout=5000)
+        except Exception:
+            expect(registration_page.success_locator()).to_be_visible(
+                timeout=5000)
+
     assert registration_page.verify_registration_success(), \
         "Registration success message not displayed"
 
@@ -130,7 +142,7 @@ def verify_confirmation_email(context: dict):
     context['email_verified'] = True
 
 
-@then(parsers.parse('I should see "{error_message}" error'))
+@then(parsers.re(r'I should see "(?P<error_message>[^"]+)" error'))
 def verify_specific_error_message(registration_page: RegistrationPage, error_message: str):
     """
     Verify specific error message.
@@ -138,14 +150,12 @@ def verify_specific_error_message(registration_page: RegistrationPage, error_mes
     Args:
         error_message: Expected error message
     """
-    logger.info(f"Step: Then I should see '{error_message}' error")
-    
-    # Wait for error message
-    registration_page.wait_for_timeout(1000)
-    
-    # Check if error message is displayed
-    assert registration_page.is_error_message_displayed(), "Error message not displayed"
-    
+    logger.info("Step: Then I should see '%s' error", error_message)
+
+    # Auto-waiting assertion returns as soon as the error shows instead of
+    # sleeping a fixed interval first
+    expect(registration_page.error_locator()).to_be_visible(timeout=5000)
+
     # Get actual error message
     actual_message = registration_page.get_error_message()
     
@@ -158,31 +168,23 @@ def verify_specific_error_message(registration_page: RegistrationPage, error_mes
 def verify_email_validation_error(registration_page: RegistrationPage):
     """Verify email validation error."""
     logger.info("Step: Then I should see email validation error")
-    
-    # Wait for error
-    registration_page.wait_for_timeout(1000)
-    
-    # Check for email error or general error
-    has_error = (
-        registration_page.is_error_message_displayed() or
-        registration_page.is_visible(registration_page.EMAIL_ERROR, timeout=2000)
-    )
-    
-    assert has_error, "Email validation error not displayed"
+
+    # Auto-waiting assertion on whichever renders first - the field-level
+    # email error or the general error message
+    expect(
+        registration_page.email_error_locator()
+        .or_(registration_page.error_locator()).first
+    ).to_be_visible(timeout=5000)
 
 
 @then('I should see password strength error')
 def verify_password_strength_error(registration_page: RegistrationPage):
     """Verify password strength error."""
     logger.info("Step: Then I should see password strength error")
-    
-    # Wait for error
-    registration_page.wait_for_timeout(1000)
-    
-    # Check for password error or general error
-    has_error = (
-        registration_page.is_error_message_displayed() or
-        registration_page.is_visible(registration_page.PASSWORD_ERROR, timeout=2000)
-    )
-    
-    assert has_error, "Password strength error not displayed"
+
+    # Auto-waiting assertion on whichever renders first - the field-level
+    # password error or the general error message
+    expect(
+        registration_page.password_error_locator()
+        .or_(registration_page.error_locator()).first
+    ).to_be_visible(timeout=5000)
@@ -44,7 +44,7 @@ def verify_can_see_page_title(winvinaya_foundation_page: WinVinayaFoundationPage
     print(f"\n📄 Page Title: {title}")
 
 
-@then(parsers.parse('the page title should contain "{expected_text}"'))
+@then(parsers.re(r'the page title should contain "(?P<expected_text>[^"]+)"'))
 def verify_title_contains_text(winvinaya_foundation_page: WinVinayaFoundationPage, expected_text: str):
     """
     Verify that page title contains expected text.
@@ -52,15 +52,16 @@ def verify_title_contains_text(winvinaya_foundation_page: WinVinayaFoundationPag
     Args:
         expected_text: Text that should be in the title
     """
-    logger.info(f"Step: Then the page title should contain '{expected_text}'")
+    logger.info("Step: Then the page title should contain '%s'", expected_text)
+    # Fetch the title once and compare locally - verify_title_contains
+    # would issue a second page.title() round-trip for the same value
     title = winvinaya_foundation_page.get_page_title()
-    
-    # If it fails, log the actual title clearly
-    if not winvinaya_foundation_page.verify_title_contains(expected_text):
-        logger.error(f"Title mismatch! Expected to contain '{expected_text}', but got '{title}'")
-        # For the sake of passing this demo if 'Home' is the actual title, 
+
+    if expected_text.lower() not in title.lower():
+        logger.error("Title mismatch! Expected to contain '%s', but got '%s'", expected_text, title)
+        # For the sake of passing this demo if 'Home' is the actual title,
         # let's be flexible but log it.
-        assert expected_text.lower() in title.lower() or "winvinaya foundation" in title.lower(), \
+        assert "winvinaya foundation" in title.lower(), \
             f"Page title '{title}' does not contain '{expected_text}' or 'WinVinaya Foundation'"
 
 @then('the main heading should contain "WinVinaya" or "Reflections"')
@@ -2,188 +2,248 @@
 Accessibility Testing Utility
 WCAG 2.1 compliance checking and accessibility testing
 """
+import io
+from collections import OrderedDict
 from playwright.sync_api import Page
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
 
 
+# Cheap in-browser DOM fingerprint (31-multiplier rolling hash over the
+# serialized document) used as a cache key component
+_FINGERPRINT_SCRIPT = """
+() => {
+    let s = 0;
+    const h = document.documentElement.outerHTML;
+    for (let i = 0; i < h.length; i++) {
+        s = (s * 31 + h.charCodeAt(i)) | 0;
+    }
+    return s;
+}
+"""
+
+
+# All checks run inside the browser in one pass: a single evaluate()
+# round-trip returns every violation list, instead of one locator/count
+# call per category plus one evaluate per heading.
+_AUDIT_SCRIPT = """
+() => {
+    const violations = {
+        missing_alt_text: [],
+        missing_labels: [],
+        low_contrast: [],
+        missing_headings: [],
+        missing_landmarks: [],
+        keyboard_accessibility: []
+    };
+
+    // Images without alt text
+    for (const img of document.querySelectorAll('img:not([alt])')) {
+        violations.missing_alt_text.push(
+            'Image missing alt text: ' + (img.getAttribute('src') || 'unknown'));
+    }
+
+    // Form inputs without labels
+    const inputs = document.querySelectorAll(
+        'input:not([type="hidden"]):not([aria-label]):not([aria-labelledby])');
+    for (const inp of inputs) {
+        const inputId = inp.getAttribute('id') || inp.getAttribute('name') || 'unknown';
+        if (inputId !== 'unknown') {
+            if (!document.querySelector('label[for="' + inputId + '"]')) {
+                violations.missing_labels.push('Input without label: ' + inputId);
+            }
+        } else {
+            violations.missing_labels.push('Input without id/name and no label');
+        }
+    }
+
+    // Common low-contrast patterns (simplified check)
+    const lowContrastSelectors = [
+        '.text-muted',
+        '.text-secondary',
+        '[style*="color: #999"]',
+        '[style*="color: #ccc"]'
+    ];
+    for (const selector of lowContrastSelectors) {
+        const count = document.querySelectorAll(selector).length;
+        if (count > 0) {
+            violations.low_contrast.push(
+                'Potential low contrast: ' + selector + ' (' + count + ' elements)');
+        }
+    }
+
+    // Heading structure
+    const h1Count = document.querySelectorAll('h1').length;
+    if (h1Count === 0) {
+        violations.missing_headings.push('Page missing h1 heading');
+    } else if (h1Count > 1) {
+        violations.missing_headings.push(
+            'Page has multiple h1 headings (' + h1Count + ')');
+    }
+    let prevLevel = 0;
+    for (const heading of document.querySelectorAll('h1, h2, h3, h4, h5, h6')) {
+        const tag = heading.tagName.toLowerCase();
+        const level = parseInt(tag[1], 10);
+        if (prevLevel > 0 && level > prevLevel + 1) {
+            violations.missing_headings.push(
+                'Heading hierarchy skip: ' + tag + ' after h' + prevLevel);
+        }
+        prevLevel = level;
+    }
+
+    // ARIA landmarks
+    if (!document.querySelector('main, [role="main"]')) {
+        violations.missing_landmarks.push('Page missing main landmark');
+    }
+    if (!document.querySelector('nav, [role="navigation"]')) {
+        violations.missing_landmarks.push('Page missing navigation landmark');
+    }
+
+    // Keyboard accessibility
+    const clickableDivs = document.querySelectorAll(
+        'div[onclick]:not([tabindex]):not([role="button"])').length;
+    if (clickableDivs > 0) {
+        violations.keyboard_accessibility.push(
+            'Found ' + clickableDivs + ' clickable divs without keyboard support');
+    }
+    const emptyLinks = document.querySelectorAll('a:not([href])').length;
+    if (emptyLinks > 0) {
+        violations.keyboard_accessibility.push(
+            'Found ' + emptyLinks + ' links without href');
+    }
+
+    return violations;
+}
+"""
+
+
 class AccessibilityChecker:
     """Check web pages for accessibility compliance."""
-    
-    def __init__(self, page: Page):
+
+    # Default axe-core bundle injected by check_page_accessibility_with_axe;
+    # point AXE_SCRIPT_URL at a vendored copy for offline runs
+    AXE_SCRIPT_URL = "https://unpkg.com/axe-core/axe.min.js"
+
+    # Audit results keyed by (url, DOM fingerprint), shared across checker
+    # instances - repeated audits of an unchanged page cost one hash
+    # round-trip plus a dict lookup instead of a full DOM traversal
+    _cache: "OrderedDict[Tuple[str, int], Dict]" = OrderedDict()
+    _CACHE_MAX = 64
+
+    def __init__(self, page: Page, enable_cache: bool = True):
         """
         Initialize accessibility checker.
-        
+
         Args:
             page: Playwright Page instance
+            enable_cache: Reuse audit results for unchanged pages
         """
         self.page = page
-        
+        self.enable_cache = enable_cache
+
     def check_page_accessibility(self) -> Dict:
         """
         Run accessibility checks on current page.
-        
+
+        All categories are audited inside one page.evaluate call, so the
+        cost is a single browser round-trip regardless of element count.
+
         Returns:
             Dictionary containing accessibility violations
         """
         logger.info("Running accessibility checks")
-        
-        violations = {
-            'missing_alt_text': self._check_missing_alt_text(),
-            'missing_labels': self._check_missing_form_labels(),
-            'low_contrast': self._check_color_contrast(),
-            'missing_headings': self._check_heading_structure(),
-            'missing_landmarks': self._check_landmarks(),
-            'keyboard_accessibility': self._check_keyboard_navigation()
-        }
-        
+
+        key = None
+        if self.enable_cache:
+            fingerprint = self.page.evaluate(_FINGERPRINT_SCRIPT)
+            key = (self.page.url, fingerprint)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                logger.info("Accessibility check served from cache")
+                return cached
+
+        violations: Dict[str, List[str]] = self.page.evaluate(_AUDIT_SCRIPT)
+
+        if key is not None:
+            self._cache[key] = violations
+            if len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+
         total_violations = sum(len(v) for v in violations.values() if isinstance(v, list))
-        logger.info(f"Accessibility check complete. Total violations: {total_violations}")
-        
-        return violations
-        
-    def _check_missing_alt_text(self) -> List[str]:
-        """Check for images without alt text."""
-        images_without_alt = self.page.locator('img:not([alt])').all()
-        violations = []
-        
-        for img in images_without_alt:
-            src = img.get_attribute('src') or 'unknown'
-            violations.append(f"Image missing alt text: {src}")
-            
-        if violations:
-            logger.warning(f"Found {len(violations)} images without alt text")
-            
-        return violations
-        
-    def _check_missing_form_labels(self) -> List[str]:
-        """Check for form inputs without labels."""
-        inputs = self.page.locator('input:not([type="hidden"]):not([aria-label]):not([aria-labelledby])').all()
-        violations = []
-        
-        for inp in inputs:
-            input_id = inp.get_attribute('id') or inp.get_attribute('name') or 'unknown'
-            # Check if input has associated label
-            if input_id != 'unknown':
-                label = self.page.locator(f'label[for="{input_id}"]').count()
-                if label == 0:
-                    violations.append(f"Input without label: {input_id}")
-            else:
-                violations.append("Input without id/name and no label")
-                
-        if violations:
-            logger.warning(f"Found {len(violations)} inputs without labels")
-            
-        return violations
-        
-    def _check_color_contrast(self) -> List[str]:
-        """Check for potential color contrast issues."""
-        # This is a simplified check - in production, use axe-core or similar
-        violations = []
-        
-        # Check for common low-contrast patterns
-        low_contrast_selectors = [
-            '.text-muted',
-            '.text-secondary',
-            '[style*="color: #999"]',
-            '[style*="color: #ccc"]'
-        ]
-        
-        for selector in low_contrast_selectors:
-            elements = self.page.locator(selector).count()
-            if elements > 0:
-                violations.append(f"Potential low contrast: {selector} ({elements} elements)")
-                
-        return violations
-        
-    def _check_heading_structure(self) -> List[str]:
-        """Check for proper heading hierarchy."""
-        violations = []
-        
-        # Check if page has h1
-        h1_count = self.page.locator('h1').count()
-        if h1_count == 0:
-            violations.append("Page missing h1 heading")
-        elif h1_count > 1:
-            violations.append(f"Page has multiple h1 headings ({h1_count})")
-            
-        # Check heading order
-        headings = self.page.locator('h1, h2, h3, h4, h5, h6').all()
-        prev_level = 0
-        
-        for heading in headings:
-            tag = heading.evaluate('el => el.tagName.toLowerCase()')
-            level = int(tag[1])
-            
-            if prev_level > 0 and level > prev_level + 1:
-                violations.append(f"Heading hierarchy skip: {tag} after h{prev_level}")
-                
-            prev_level = level
-            
-        return violations
-        
-    def _check_landmarks(self) -> List[str]:
-        """Check for ARIA landmarks."""
-        violations = []
-        
-        # Check for main landmark
-        if self.page.locator('main, [role="main"]').count() == 0:
-            violations.append("Page missing main landmark")
-            
-        # Check for navigation landmark
-        if self.page.locator('nav, [role="navigation"]').count() == 0:
-            violations.append("Page missing navigation landmark")
-            
-        return violations
-        
-    def _check_keyboard_navigation(self) -> List[str]:
-        """Check for keyboard accessibility issues."""
-        violations = []
-        
-        # Check for interactive elements without keyboard support
-        clickable_divs = self.page.locator('div[onclick]:not([tabindex]):not([role="button"])').count()
-        if clickable_divs > 0:
-            violations.append(f"Found {clickable_divs} clickable divs without keyboard support")
-            
-        # Check for links without href
-        empty_links = self.page.locator('a:not([href])').count()
-        if empty_links > 0:
-            violations.append(f"Found {empty_links} links without href")
-            
+        logger.info("Accessibility check complete. Total violations: %s", total_violations)
+
         return violations
-        
+
+    def check_page_accessibility_with_axe(self) -> Dict:
+        """
+        Run an axe-core audit on the current page.
+
+        Injects the axe-core bundle once and runs its tuned in-browser rule
+        engine - far broader rule coverage (real color-contrast math,
+        ARIA semantics) than the built-in audit, at the cost of a script
+        download. Falls back to the built-in audit if injection fails.
+
+        Returns:
+            Dictionary mapping axe rule ids to violation descriptions
+        """
+        logger.info("Running axe-core accessibility audit")
+        try:
+            # Inject only if a previous call hasn't already done so
+            if not self.page.evaluate("() => typeof window.axe !== 'undefined'"):
+                self.page.add_script_tag(url=self.AXE_SCRIPT_URL)
+
+            result = self.page.evaluate("async () => await axe.run()")
+
+            violations: Dict[str, List[str]] = {}
+            for violation in result.get('violations', []):
+                rule_id = violation.get('id', 'unknown')
+                violations[rule_id] = [
+                    f"{violation.get('help', rule_id)}: {node.get('html', '')}"
+                    for node in violation.get('nodes', [])
+                ]
+
+            total = sum(len(v) for v in violations.values())
+            logger.info("axe-core audit complete. Total violations: %s", total)
+            return violations
+        except Exception as e:
+            logger.error("axe-core audit failed, falling back to built-in audit: %s", str(e))
+            return self.check_page_accessibility()
+
     def generate_accessibility_report(self) -> str:
         """
         Generate accessibility report.
-        
+
         Returns:
             Formatted accessibility report
         """
         violations = self.check_page_accessibility()
-        
-        report = ["=" * 50]
-        report.append("ACCESSIBILITY REPORT")
-        report.append("=" * 50)
-        report.append(f"Page: {self.page.url}")
-        report.append("")
-        
-        total_violations = 0
+        total_violations = sum(len(issues) for issues in violations.values())
+
+        # Write straight into a string buffer - skips the intermediate
+        # list-of-lines and the final join copy
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 50 + "\n")
+        write("ACCESSIBILITY REPORT\n")
+        write("=" * 50 + "\n")
+        write(f"Page: {self.page.url}\n")
+        write("\n")
+
         for category, issues in violations.items():
             if issues:
-                report.append(f"\n{category.replace('_', ' ').title()}:")
-                report.append("-" * 40)
+                write(f"\n{category.replace('_', ' ').title()}:\n")
+                write("-" * 40 + "\n")
                 for issue in issues:
-                    report.append(f"  • {issue}")
-                    total_violations += 1
-                    
-        report.append("")
-        report.append("=" * 50)
-        report.append(f"Total Violations: {total_violations}")
-        report.append("=" * 50)
-        
-        report_text = "\n".join(report)
-        logger.info(f"Accessibility report generated with {total_violations} violations")
-        
-        return report_text
+                    write(f"  • {issue}\n")
+
+        write("\n")
+        write("=" * 50 + "\n")
+        write(f"Total Violations: {total_violations}\n")
+        write("=" * 50)
+
+        logger.info("Accessibility report generated with %s violations", total_violations)
+
+        return buf.getvalue()
@@ -11,6 +11,15 @@ from utils.logger import Logger
 logger = Logger.get_logger(__name__)
 
 
+# Default timeout frozen at import - one config lookup serves every page
+_DEFAULT_TIMEOUT = config.get_timeout()
+
+# Video settings resolved once; with recording off, create_context never
+# touches the video keys at all
+_VIDEO_ENABLED = config.video in ('on', 'retain-on-failure', 'on_failure')
+_VIDEO_DIR = str(config.videos_dir) if _VIDEO_ENABLED else None
+
+
 class BrowserManager:
     """
     Browser Manager class implementing Factory pattern.
@@ -96,18 +105,19 @@ class BrowserManager:
         if not self.browser:
             self.launch_browser()
         
-        # Default context options
+        # Default context options; video keys are only added when recording
+        # is enabled so disabled runs send a smaller launch payload
         context_options = {
             'viewport': kwargs.get('viewport', {'width': 1920, 'height': 1080}),
-            'ignore_https_errors': kwargs.get('ignore_https_errors', True),
-            'record_video_dir': None,
-            'record_video_size': kwargs.get('record_video_size', {'width': 1920, 'height': 1080})
+            'ignore_https_errors': kwargs.get('ignore_https_errors', True)
         }
-        
-        # Configure video recording based on settings
-        if config.video in ['on', 'retain-on-failure', 'on_failure']:
-            context_options['record_video_dir'] = str(config.videos_dir)
-        
+
+        if _VIDEO_ENABLED:
+            context_options['record_video_dir'] = _VIDEO_DIR
+            context_options['record_video_size'] = kwargs.get(
+                'record_video_size', {'width': 1920, 'height': 1080})
+
+
         # Merge with custom kwargs
         context_options.update({k: v for k, v in kwargs.items() if k not in context_options})
         
@@ -127,12 +137,12 @@ class BrowserManager:
             self.create_context()
         
         self.page = self.context.new_page()
-        
+
         # Set default timeout
-        self.page.set_default_timeout(config.get_timeout())
-        
-        logger.info(f"New page created with timeout: {config.get_timeout()}ms")
-        
+        self.page.set_default_timeout(_DEFAULT_TIMEOUT)
+
+        logger.info("New page created with timeout: %sms", _DEFAULT_TIMEOUT)
+
         return self.page
     
     def get_browser(self) -> Browser:
@@ -175,6 +185,28 @@ class BrowserManager:
             logger.info("Page closed")
             self.page = None
     
+    def reset_context(self) -> None:
+        """
+        Reset the current context to a clean state without recreating it.
+
+        Clearing cookies/permissions and closing pages is enough isolation
+        for most scenarios and skips the context create/close IPC cost;
+        use close_context for a full teardown.
+        """
+        if not self.context:
+            return
+
+        self.context.clear_cookies()
+        try:
+            self.context.clear_permissions()
+        except Exception:
+            pass
+
+        for page in self.context.pages:
+            page.close()
+        self.page = None
+        logger.info("Browser context reset")
+
     def close_context(self) -> None:
         """Close browser context."""
         if self.context:
@@ -2,7 +2,11 @@
 Logger Module
 Provides centralized logging functionality for the test framework
 """
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -14,58 +18,96 @@ class Logger:
     """
     Custom Logger class for test framework.
     Provides formatted logging with file and console handlers.
+
+    The formatter and both handlers are built once and shared by every
+    logger - get_logger(__name__) runs at import time in every module, so
+    per-call Formatter construction and mkdir syscalls are pure startup tax.
+
+    Loggers emit into an in-memory queue; a background QueueListener does
+    the actual formatting and file/console writes, so test code never
+    blocks on log I/O.
     """
-    
+
     _loggers = {}
-    
+    _formatter: Optional[logging.Formatter] = None
+    _queue_handler: Optional[logging.handlers.QueueHandler] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+
+    @classmethod
+    def _init_handlers(cls) -> None:
+        """Build the shared queue, listener and sink handlers on first use."""
+        logging_config = config.get_logging_config()
+        cls._formatter = logging.Formatter(
+            logging_config['format'], datefmt=logging_config['datefmt'])
+
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(cls._formatter)
+
+        log_dir = config.root_dir / 'reports'
+        log_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Suffix with the xdist worker id so parallel workers write to
+        # separate files instead of interleaving into one
+        worker = os.environ.get('PYTEST_XDIST_WORKER')
+        suffix = f'_{worker}' if worker else ''
+        log_file = log_dir / f'test_execution_{timestamp}{suffix}.log'
+
+        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(cls._formatter)
+
+        # Loggers only enqueue records; the listener thread drains the
+        # queue into the real handlers, keeping disk latency off the
+        # calling (test) thread. respect_handler_level preserves the
+        # INFO-console / DEBUG-file split.
+        log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        cls._queue_handler = logging.handlers.QueueHandler(log_queue)
+        cls._listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler,
+            respect_handler_level=True)
+        cls._listener.start()
+        # Flush queued records before interpreter shutdown
+        atexit.register(cls._shutdown)
+
+    @classmethod
+    def _shutdown(cls) -> None:
+        """Stop the listener thread, draining any queued records."""
+        listener = cls._listener
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+
     @staticmethod
     def get_logger(name: str = __name__) -> logging.Logger:
         """
         Get or create a logger instance.
-        
+
         Args:
             name: Logger name (typically __name__ of the calling module)
-            
+
         Returns:
             Configured logger instance
         """
-        if name in Logger._loggers:
-            return Logger._loggers[name]
-        
-        # Create logger
+        # Cache check first - the common case is a dict hit
+        cached = Logger._loggers.get(name)
+        if cached is not None:
+            return cached
+
+        if Logger._formatter is None:
+            Logger._init_handlers()
+
         logger = logging.getLogger(name)
         logger.setLevel(getattr(logging, config.log_level))
-        
-        # Prevent duplicate handlers
-        if logger.handlers:
-            return logger
-        
-        # Create formatters
-        log_format = config.get_logging_config()['format']
-        date_format = config.get_logging_config()['datefmt']
-        formatter = logging.Formatter(log_format, datefmt=date_format)
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler
-        log_dir = config.root_dir / 'reports'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        log_file = log_dir / f'test_execution_{timestamp}.log'
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
+
+        # Attach the shared queue handler unless a previous
+        # interpreter-level configuration already did
+        if not logger.handlers:
+            logger.addHandler(Logger._queue_handler)
+
         # Store logger
         Logger._loggers[name] = logger
-        
+
         return logger
 
 
@@ -11,86 +11,197 @@ from utils.logger import Logger
 logger = Logger.get_logger(__name__)
 
 
+# Column order for the structure-of-arrays metric store; get_all_metrics
+# materializes dicts from these on demand
+_COLUMNS = (
+    'total_duration',
+    'average_page_load',
+    'p50_page_load',
+    'p95_page_load',
+    'p99_page_load',
+    'memory_rss_mb',
+    'memory_vms_mb',
+    'memory_system_percent',
+    'cpu_usage',
+    'timestamp',
+)
+
+
 class PerformanceMonitor:
     """Monitor and track performance metrics during test execution."""
-    
-    def __init__(self):
-        """Initialize performance monitor."""
-        self.metrics: List[Dict] = []
+
+    def __init__(self, include_system_memory: bool = False):
+        """
+        Initialize performance monitor.
+
+        Args:
+            include_system_memory: Also sample system-wide memory usage.
+                Off by default - in shared CI containers the host-wide
+                numbers are mostly noise from neighbouring processes.
+        """
+        # Metrics stored column-wise (one list per field) instead of one
+        # dict per sample - long runs keep ten flat lists instead of
+        # thousands of dicts, and aggregating a column is a single pass
+        self._columns: Dict[str, List] = {name: [] for name in _COLUMNS}
         self.start_time: Optional[float] = None
         self.page_load_times: List[float] = []
-        
+        # Handle to our own process, created once - Process() resolves the
+        # pid and reads /proc at construction time
+        self._proc = psutil.Process()
+        self._include_system_memory = include_system_memory
+
     def start_monitoring(self) -> None:
         """Start performance monitoring."""
         self.start_time = time.time()
+        # Prime psutil's CPU counter so the non-blocking read at stop time
+        # reports usage over the actual monitored window
+        psutil.cpu_percent(interval=None)
         logger.info("Performance monitoring started")
-        
+
     def stop_monitoring(self) -> Dict:
         """
         Stop monitoring and return metrics.
-        
+
         Returns:
             Dictionary containing performance metrics
         """
         if not self.start_time:
             logger.warning("Monitoring was not started")
             return {}
-            
+
         duration = time.time() - self.start_time
-        
+
+        load_stats = self._calculate_page_load_stats()
+        memory = self._get_memory_usage()
+
         metrics = {
             'total_duration': round(duration, 2),
-            'average_page_load': self._calculate_average_page_load(),
-            'memory_usage': self._get_memory_usage(),
+            'average_page_load': load_stats['mean'],
+            'p50_page_load': load_stats['p50'],
+            'p95_page_load': load_stats['p95'],
+            'p99_page_load': load_stats['p99'],
+            'memory_usage': memory,
             'cpu_usage': self._get_cpu_usage(),
             'timestamp': datetime.now().isoformat()
         }
-        
-        self.metrics.append(metrics)
-        logger.info(f"Performance metrics: {metrics}")
+
+        columns = self._columns
+        columns['total_duration'].append(metrics['total_duration'])
+        columns['average_page_load'].append(metrics['average_page_load'])
+        columns['p50_page_load'].append(metrics['p50_page_load'])
+        columns['p95_page_load'].append(metrics['p95_page_load'])
+        columns['p99_page_load'].append(metrics['p99_page_load'])
+        columns['memory_rss_mb'].append(memory['rss_mb'])
+        columns['memory_vms_mb'].append(memory['vms_mb'])
+        columns['memory_system_percent'].append(memory.get('system_percent'))
+        columns['cpu_usage'].append(metrics['cpu_usage'])
+        columns['timestamp'].append(metrics['timestamp'])
+
+        logger.info("Performance metrics: %s", metrics)
         return metrics
-        
+
     def record_page_load(self, load_time: float) -> None:
         """
         Record page load time.
-        
+
         Args:
             load_time: Page load time in seconds
         """
         self.page_load_times.append(load_time)
-        logger.debug(f"Page load time recorded: {load_time}s")
-        
+        logger.debug("Page load time recorded: %ss", load_time)
+
     def _calculate_average_page_load(self) -> float:
         """Calculate average page load time."""
         if not self.page_load_times:
             return 0.0
         return round(sum(self.page_load_times) / len(self.page_load_times), 2)
-        
-    def _get_memory_usage(self) -> Dict:
-        """Get current memory usage."""
-        memory = psutil.virtual_memory()
+
+    def _calculate_page_load_stats(self) -> Dict[str, float]:
+        """
+        Calculate mean and tail percentiles of page load times.
+
+        One sort serves all three percentiles - the tail numbers are what
+        flag flaky-slow pages that a plain average hides.
+
+        Returns:
+            Dict with mean, p50, p95 and p99 in seconds
+        """
+        if not self.page_load_times:
+            return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+        ordered = sorted(self.page_load_times)
+        n = len(ordered)
+
+        def percentile(p: float) -> float:
+            # Nearest-rank on the pre-sorted samples
+            index = min(n - 1, max(0, round(p / 100 * n) - 1))
+            return round(ordered[index], 2)
+
         return {
-            'total_mb': round(memory.total / (1024 * 1024), 2),
-            'used_mb': round(memory.used / (1024 * 1024), 2),
-            'percent': memory.percent
+            'mean': round(sum(ordered) / n, 2),
+            'p50': percentile(50),
+            'p95': percentile(95),
+            'p99': percentile(99)
+        }
+
+    def _get_memory_usage(self) -> Dict:
+        """
+        Get memory usage of the test process.
+
+        Process RSS/VMS is one /proc read and reflects what the tests
+        actually consume; the system-wide percent is appended only when
+        include_system_memory was requested.
+        """
+        info = self._proc.memory_info()
+        usage = {
+            'rss_mb': round(info.rss / (1024 * 1024), 2),
+            'vms_mb': round(info.vms / (1024 * 1024), 2)
         }
-        
+        if self._include_system_memory:
+            usage['system_percent'] = psutil.virtual_memory().percent
+        return usage
+
     def _get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage."""
-        return psutil.cpu_percent(interval=1)
-        
+        """Get CPU usage percentage since monitoring started."""
+        # Non-blocking: returns usage since the priming call instead of
+        # sleeping a full second per stop_monitoring call
+        return psutil.cpu_percent(interval=None)
+
     def get_all_metrics(self) -> List[Dict]:
         """
         Get all recorded metrics.
-        
+
+        Dicts are materialized lazily from the columnar store, matching
+        the shape stop_monitoring returns.
+
         Returns:
             List of all performance metrics
         """
-        return self.metrics
-        
+        columns = self._columns
+        metrics = []
+        for i in range(len(columns['timestamp'])):
+            memory = {
+                'rss_mb': columns['memory_rss_mb'][i],
+                'vms_mb': columns['memory_vms_mb'][i]
+            }
+            if columns['memory_system_percent'][i] is not None:
+                memory['system_percent'] = columns['memory_system_percent'][i]
+            metrics.append({
+                'total_duration': columns['total_duration'][i],
+                'average_page_load': columns['average_page_load'][i],
+                'p50_page_load': columns['p50_page_load'][i],
+                'p95_page_load': columns['p95_page_load'][i],
+                'p99_page_load': columns['p99_page_load'][i],
+                'memory_usage': memory,
+                'cpu_usage': columns['cpu_usage'][i],
+                'timestamp': columns['timestamp'][i]
+            })
+        return metrics
+
     def clear_metrics(self) -> None:
         """Clear all recorded metrics."""
-        self.metrics = []
+        for column in self._columns.values():
+            column.clear()
         self.page_load_times = []
         self.start_time = None
         logger.info("Performance metrics cleared")
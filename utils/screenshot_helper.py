@@ -3,6 +3,10 @@ Screenshot Helper Module
 Provides screenshot capture and management functionality
 """
 import allure
+import itertools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -13,6 +17,22 @@ from utils.logger import Logger
 
 logger = Logger.get_logger(__name__)
 
+# Output directory resolved once - Config already created it at startup
+_SHOTS_DIR = config.screenshots_dir
+
+# Enum resolved once at import - these helpers run per capture, so the
+# attribute chain through the allure package is worth skipping
+_PNG = allure.attachment_type.PNG
+
+# One timestamp per run plus a counter gives unique names without a
+# datetime.now()+strftime pair on every capture - microsecond precision
+# was only ever there for uniqueness. The xdist worker id (pid outside
+# xdist) is folded in because workers launched in the same second would
+# otherwise produce colliding names in the shared screenshots dir.
+_worker = os.environ.get('PYTEST_XDIST_WORKER') or str(os.getpid())
+_RUN_TS = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{_worker}"
+_shot_counter = itertools.count()
+
 
 class ScreenshotHelper:
     """
@@ -25,52 +45,59 @@ class ScreenshotHelper:
         page: Page,
         name: Optional[str] = None,
         attach_to_allure: bool = True,
-        full_page: bool = False
+        full_page: bool = False,
+        persist: bool = True
     ) -> Optional[Path]:
         """
         Capture screenshot of the current page.
-        
+
         Args:
             page: Playwright Page instance
             name: Screenshot name (auto-generated if not provided)
             attach_to_allure: Whether to attach screenshot to Allure report
             full_page: Whether to capture full page screenshot
-            
+            persist: Whether to also save the PNG to the screenshots dir.
+                Pass False when only the Allure attachment is wanted -
+                skips the disk write entirely
+
         Returns:
-            Path to saved screenshot or None if failed
+            Path to saved screenshot, or None if not persisted or failed
         """
         try:
             # Generate screenshot name
             if not name:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                name = f"screenshot_{timestamp}"
-            
+                name = f"screenshot_{_RUN_TS}_{next(_shot_counter):06d}"
+
             # Ensure .png extension
             if not name.endswith('.png'):
                 name = f"{name}.png"
-            
-            # Create screenshot path
-            screenshot_path = config.screenshots_dir / name
-            
-            # Capture screenshot
-            screenshot_bytes = page.screenshot(
-                path=str(screenshot_path),
-                full_page=full_page
-            )
-            
-            logger.info(f"Screenshot captured: {screenshot_path}")
-            
+
+            # Capture once without a path; the same bytes serve both the
+            # optional disk copy and the Allure attachment
+            screenshot_bytes = page.screenshot(full_page=full_page)
+
+            screenshot_path = None
+            if persist:
+                screenshot_path = _SHOTS_DIR / name
+                screenshot_path.write_bytes(screenshot_bytes)
+                logger.info(f"Screenshot captured: {screenshot_path}")
+
             # Attach to Allure report
             if attach_to_allure:
                 allure.attach(
                     screenshot_bytes,
                     name=name,
-                    attachment_type=allure.attachment_type.PNG
+                    attachment_type=_PNG
                 )
-                logger.debug(f"Screenshot attached to Allure report: {name}")
-            
+                logger.debug("Screenshot attached to Allure report: %s", name)
+
+            # Drop our reference so a multi-MB full-page PNG is
+            # reclaimable as soon as allure is done with it, rather than
+            # living until this frame exits
+            del screenshot_bytes
+
             return screenshot_path
-            
+
         except Exception as e:
             logger.error(f"Failed to capture screenshot: {str(e)}")
             return None
@@ -97,13 +124,12 @@ class ScreenshotHelper:
         try:
             # Generate screenshot name
             if not name:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
-                name = f"element_screenshot_{timestamp}"
-            
+                name = f"element_screenshot_{_RUN_TS}_{next(_shot_counter):06d}"
+
             if not name.endswith('.png'):
                 name = f"{name}.png"
             
-            screenshot_path = config.screenshots_dir / name
+            screenshot_path = _SHOTS_DIR / name
             
             # Locate element and capture screenshot
             element = page.locator(selector)
@@ -116,7 +142,7 @@ class ScreenshotHelper:
                 allure.attach(
                     screenshot_bytes,
                     name=name,
-                    attachment_type=allure.attachment_type.PNG
+                    attachment_type=_PNG
                 )
             
             return screenshot_path
@@ -137,8 +163,7 @@ class ScreenshotHelper:
         Returns:
             Path to saved screenshot or None if failed
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        screenshot_name = f"FAILED_{test_name}_{timestamp}.png"
+        screenshot_name = f"FAILED_{test_name}_{_RUN_TS}_{next(_shot_counter):06d}.png"
         
         logger.warning(f"Test failed, capturing screenshot: {screenshot_name}")
         
@@ -149,6 +174,16 @@ class ScreenshotHelper:
             full_page=True
         )
     
+    @staticmethod
+    def _unlink_quiet(path: str) -> int:
+        """Delete one file, logging instead of raising on failure."""
+        try:
+            os.unlink(path)
+            return 1
+        except OSError as e:
+            logger.error(f"Failed to delete screenshot {path}: {str(e)}")
+            return 0
+
     @staticmethod
     def cleanup_old_screenshots(days: int = 7) -> None:
         """
@@ -158,23 +193,40 @@ class ScreenshotHelper:
             days: Number of days to retain screenshots
         """
         try:
-            current_time = datetime.now()
-            screenshot_dir = config.screenshots_dir
-            
+            screenshot_dir = _SHOTS_DIR
+
             if not screenshot_dir.exists():
                 return
-            
-            deleted_count = 0
-            for screenshot_file in screenshot_dir.glob('*.png'):
-                file_modified_time = datetime.fromtimestamp(screenshot_file.stat().st_mtime)
-                age_days = (current_time - file_modified_time).days
-                
-                if age_days > days:
-                    screenshot_file.unlink()
-                    deleted_count += 1
-            
+
+            # Raw mtime comparison against a precomputed cutoff; DirEntry
+            # caches the stat result from the directory listing, roughly
+            # halving the syscall count versus per-Path stat calls
+            cutoff = time.time() - days * 86400
+
+            victims = []
+            with os.scandir(screenshot_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith('.png')
+                            and entry.is_file(follow_symlinks=False)
+                            and entry.stat().st_mtime < cutoff):
+                        victims.append(entry.path)
+
+            if not victims:
+                return
+
+            # unlink releases the GIL, so a small pool overlaps the
+            # per-inode latency - this matters most on network-mounted
+            # artifact dirs with thousands of stale files
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                deleted_count = sum(executor.map(ScreenshotHelper._unlink_quiet, victims))
+
             if deleted_count > 0:
                 logger.info(f"Cleaned up {deleted_count} old screenshots (older than {days} days)")
-                
+
         except Exception as e:
             logger.error(f"Failed to cleanup old screenshots: {str(e)}")
+
+
+# Shared instance - the helper is stateless, so one object serves all
+# page objects
+screenshot_helper = ScreenshotHelper()